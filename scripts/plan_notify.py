@@ -28,11 +28,10 @@ def main():
         print("Usage: plan_notify.py <block_index>")
         return 1
 
-    try:
-        block_idx = int(sys.argv[1])
-    except ValueError:
+    if not sys.argv[1].isdecimal():
         print(f"Invalid block index: {sys.argv[1]}")
         return 1
+    block_idx = int(sys.argv[1])
 
     plan = load_plan()
     if not plan:
@@ -37,6 +37,11 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson  # Optional: C-speed JSON (pip install orjson)
+except ImportError:
+    orjson = None
+
 TRACKER_PATH = Path(__file__).parent.parent / "tracker.json"
 
 # Short codes for courses (easier to type!)
@@ -62,13 +67,18 @@ def resolve_course_code(code):
     return code.upper()
 
 def load_tracker():
-    with open(TRACKER_PATH, 'r') as f:
-        return json.load(f)
+    raw = TRACKER_PATH.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 def save_tracker(data):
     data['last_updated'] = datetime.now().strftime('%Y-%m-%d')
-    with open(TRACKER_PATH, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Same compact UTF-8 bytes as src.data.save_tracker, with or without
+    # orjson, so switching tools doesn't rewrite the whole file
+    if orjson:
+        out = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        out = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    TRACKER_PATH.write_bytes(out)
     print(f"Tracker updated: {TRACKER_PATH}")
 
 def show_courses():
@@ -217,6 +227,9 @@ def set_paper(title):
     save_tracker(data)
     print(f"Paper study topic set to: {title}")
 
+# Parsed deadline strings, so repeated dates are only parsed once
+_DEADLINE_CACHE = {}
+
 def show_next_deadlines():
     data = load_tracker()
     deadlines = []
@@ -235,7 +248,10 @@ def show_next_deadlines():
                 # Handle date range (e.g., "2026-03-16 to 2026-03-20")
                 if ' to ' in deadline:
                     deadline = deadline.split(' to ')[0]
-                deadline_date = datetime.strptime(deadline, '%Y-%m-%d')
+                deadline_date = _DEADLINE_CACHE.get(deadline)
+                if deadline_date is None:
+                    deadline_date = datetime.strptime(deadline, '%Y-%m-%d')
+                    _DEADLINE_CACHE[deadline] = deadline_date
                 deadlines.append((deadline_date, code, assessment['name'], status))
             except:
                 pass
@@ -264,6 +280,10 @@ def show_next_deadlines():
         print(f"  [{alias}] {course_name}")
         print(f"  {status} | {days_str}")
 
+def _join_args(args):
+    """Join multi-word arguments, skipping the join for a single (quoted) arg"""
+    return args[0] if len(args) == 1 else ' '.join(args)
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -282,9 +302,9 @@ def main():
     elif command == 'hours' and len(sys.argv) >= 3:
         log_hours(sys.argv[2])
     elif command == 'partner' and len(sys.argv) >= 3:
-        set_partner(' '.join(sys.argv[2:]))
+        set_partner(_join_args(sys.argv[2:]))
     elif command == 'paper' and len(sys.argv) >= 3:
-        set_paper(' '.join(sys.argv[2:]))
+        set_paper(_join_args(sys.argv[2:]))
     elif command == 'next':
         show_next_deadlines()
     else:
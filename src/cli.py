@@ -12,23 +12,17 @@ Everything else delegates to Taskwarrior.
 
 import sys
 import os
+import re
 import subprocess
 import shutil
-from typing import Optional, List
+from functools import lru_cache
+from typing import Callable, Dict, Optional, List, Tuple
 from pathlib import Path
 
-# Add src to path
-SRC_DIR = Path(__file__).parent
-BASE_DIR = SRC_DIR.parent
-sys.path.insert(0, str(SRC_DIR.parent))
-
-from src.planner import (
-    create_plan,
-    get_plan_status,
-    stop_plan,
-    load_plan,
-    log_hours_timewarrior,
-)
+# Resolved with os.path string ops; subprocess takes the string as-is
+_BASE_DIR_STR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+BASE_DIR = Path(_BASE_DIR_STR)
+
 from src.ui import (
     Colors,
     bold,
@@ -43,17 +37,27 @@ from src.ui import (
     print_info,
 )
 from src.errors import (
+    StudyTrackerError,
     ValidationError,
+    DataError,
+    DataNotFoundError,
+    DataCorruptedError,
+    DataWriteError,
     CalendarError,
     CalendarConnectionError,
     CalendarPermissionError,
     CalendarTimeoutError,
+    GitError,
+    GitNotInstalledError,
+    GitNotRepoError,
+    GitCommandError,
+    GitPushError,
+    GitPullError,
 )
 
 
-def print_help():
-    """Print help message with colors."""
-    print(f"""
+# Help text is built once at import; the plain variant serves --no-color
+_HELP_TEXT = f"""
 {bold("Study CLI")} - Thin wrapper around Taskwarrior
 
 {bold("CUSTOM COMMANDS:")}
@@ -92,7 +96,25 @@ def print_help():
     study plan 1h do, 1h pc   {dim("# Start 2-block study session")}
     task project:pc           {dim("# Show all PC tasks")}
     task 5 done               {dim("# Mark task 5 complete")}
-""")
+
+"""
+_HELP_TEXT_PLAIN = re.sub(r"\033\[[0-9;]*m", "", _HELP_TEXT)
+_HELP_BYTES = _HELP_TEXT.encode("utf-8")
+_HELP_BYTES_PLAIN = _HELP_TEXT_PLAIN.encode("utf-8")
+
+
+def print_help():
+    """Print help message with colors."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stream (e.g. redirected to StringIO)
+        sys.stdout.write(_HELP_TEXT if Colors._enabled else _HELP_TEXT_PLAIN)
+        return
+
+    # Write pre-encoded bytes, bypassing the text layer
+    sys.stdout.flush()
+    buffer.write(_HELP_BYTES if Colors._enabled else _HELP_BYTES_PLAIN)
+    buffer.flush()
 
 
 def cmd_calendar():
@@ -130,6 +152,8 @@ def cmd_calendar():
 
 def cmd_hours(args: List[str]):
     """Log hours to Timewarrior."""
+    from src.planner import log_hours_timewarrior
+
     if not args:
         print("Usage: study hours <hours> [course]")
         print(f"\n{dim('Examples:')}")
@@ -158,8 +182,19 @@ def cmd_hours(args: List[str]):
         return 1
 
 
+@lru_cache(maxsize=128)
+def _format_duration(mins: int) -> str:
+    """Format a block duration, e.g. 45 -> '45m', 90 -> '1h30m', 120 -> '2h'."""
+    if mins < 60:
+        return f"{mins}m"
+    hours, rem = divmod(mins, 60)
+    return f"{hours}h{rem}m" if rem else f"{hours}h"
+
+
 def cmd_plan(args: List[str]):
     """Start a study plan."""
+    from src.planner import create_plan, get_plan_status, load_plan
+
     if not args:
         return cmd_plan_status()
 
@@ -187,11 +222,7 @@ def cmd_plan(args: List[str]):
         for i, block in enumerate(blocks):
             duration = block["duration_mins"]
             total_mins += duration
-            if duration >= 60:
-                dur_str = f"{duration // 60}h{duration % 60}m" if duration % 60 else f"{duration // 60}h"
-            else:
-                dur_str = f"{duration}m"
-            print(f"  {i + 1}. {block['course_name']} ({dur_str})")
+            print(f"  {i + 1}. {block['course_name']} ({_format_duration(duration)})")
 
         print()
         print(f"Total: {total_mins / 60:.1f} hours")
@@ -211,6 +242,8 @@ def cmd_plan(args: List[str]):
 
 def cmd_plan_status():
     """Show current plan status."""
+    from src.planner import get_plan_status
+
     status = get_plan_status()
 
     if not status:
@@ -239,8 +272,7 @@ def cmd_plan_status():
     print()
     current_idx = status.get("current_block", 0)
     for i, block in enumerate(status.get("blocks", [])):
-        dur = block["duration_mins"]
-        dur_str = f"{dur}m" if dur < 60 else f"{dur // 60}h{dur % 60}m" if dur % 60 else f"{dur // 60}h"
+        dur_str = _format_duration(block["duration_mins"])
         if i < current_idx:
             print(f"  {green('✓')} {dim(block['course_name'])} ({dur_str})")
         elif i == current_idx:
@@ -253,6 +285,8 @@ def cmd_plan_status():
 
 def cmd_plan_stop():
     """Stop the current plan and log hours to Timewarrior."""
+    from src.planner import get_plan_status, stop_plan, clear_plan
+
     status = get_plan_status()
 
     if not status:
@@ -261,7 +295,6 @@ def cmd_plan_stop():
 
     if status.get("completed"):
         print_info("Plan already completed")
-        from src.planner import clear_plan
         clear_plan()
         return 0
 
@@ -279,35 +312,143 @@ def cmd_plan_stop():
     return 0
 
 
+# Git capabilities, probed lazily once per process
+_git_caps: Dict[str, str] = {}
+
+
+def _check_git_installed() -> str:
+    """
+    Locate git, caching the result for the process lifetime.
+
+    Returns:
+        Absolute path to the git executable. Passing it to subprocess also
+        skips the PATH search exec would otherwise repeat for every command.
+
+    Raises:
+        GitNotInstalledError: If git is not in PATH
+    """
+    if "path" not in _git_caps:
+        _git_caps["path"] = shutil.which("git") or ""
+    if not _git_caps["path"]:
+        raise GitNotInstalledError()
+    return _git_caps["path"]
+
+
+# Reason given in git errors: the details were already printed by git itself
+_GIT_OUTPUT_ABOVE = "see git output above"
+
+
+def _run_git_command(
+    args: List[str],
+    quiet: bool = False,
+    binary: bool = False,
+    capture_stdout: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    Run a git command in the study directory.
+
+    Args:
+        args: Command arguments (without 'git' prefix)
+        quiet: Discard stderr. For probes whose failure is handled by the
+            caller; otherwise git's progress, summaries, hook output and
+            errors go straight to the terminal.
+        binary: Return raw bytes instead of decoding output as text
+        capture_stdout: Capture stdout for parsing. Left off, git's output
+            (commit summaries, merge conflicts) goes straight to the terminal.
+
+    Returns:
+        CompletedProcess result
+
+    Raises:
+        GitNotInstalledError: If git is not in PATH
+    """
+    return subprocess.run(
+        [_check_git_installed()] + args,
+        cwd=_BASE_DIR_STR,
+        stdout=subprocess.PIPE if capture_stdout else None,
+        stderr=subprocess.DEVNULL if quiet else None,
+        text=not binary,
+    )
+
+
+def _parse_branch_header(header: str) -> Tuple[str, bool]:
+    """
+    Parse the '## ...' line of 'git status --porcelain --branch'.
+
+    Examples:
+        '## main...origin/main [ahead 1]' -> ('main', True)
+        '## main'                         -> ('main', False)
+        '## No commits yet on main'       -> ('main', False)
+
+    Returns:
+        Tuple of (branch_name, has_upstream)
+    """
+    info = header[3:].strip()
+    if info.startswith("No commits yet on "):
+        return info[len("No commits yet on "):], False
+    branch, _, upstream = info.partition("...")
+    return branch, bool(upstream)
+
+
 def cmd_sync(args: List[str]):
     """Git sync command."""
     msg = " ".join(args) or "Update progress"
 
     try:
-        result = subprocess.run(
-            ["git", "status", "-s"],
-            cwd=BASE_DIR,
-            capture_output=True,
-            text=True,
+        # One call gives both the changes and the branch/upstream info
+        # Kept as bytes: only the header is decoded unless there is something to show
+        result = _run_git_command(
+            ["status", "--porcelain", "--branch"],
+            quiet=True,
+            binary=True,
+            capture_stdout=True,
         )
+        if result.returncode != 0:
+            raise GitNotRepoError(_BASE_DIR_STR)
+
+        header, _, changes = result.stdout.partition(b"\n")
+        _, has_upstream = _parse_branch_header(header.decode())
 
-        if not result.stdout.strip():
+        if not changes.strip():
             print_info("Nothing to sync - working tree clean")
             return 0
 
         print(f"\n{bold('Changes to sync:')}")
-        print(result.stdout)
+        print(changes.decode())
 
-        subprocess.run(["git", "add", "-A"], cwd=BASE_DIR)
-        subprocess.run(
-            ["git", "commit", "-m", f"{msg}\n\nCo-Authored-By: Claude Opus 4.5 <noreply@anthropic.com>"],
-            cwd=BASE_DIR,
-        )
-        subprocess.run(["git", "push"], cwd=BASE_DIR)
+        commit_msg = f"{msg}\n\nCo-Authored-By: Claude Opus 4.5 <noreply@anthropic.com>"
+
+        # 'commit -a' stages tracked files itself; only new files need 'add -A'
+        has_untracked = changes.startswith(b"??") or b"\n??" in changes
+        if has_untracked:
+            git_steps = [["add", "-A"], ["commit", "-m", commit_msg]]
+        else:
+            git_steps = [["commit", "-a", "-m", commit_msg]]
+
+        # Each step is exec'd directly and stops the sync on failure. Wrapping
+        # them in one 'sh -c' script would add a shell process without saving
+        # any git ones, and would lose the per-step error reporting. git
+        # writes its own output (including why a step failed) to the terminal.
+        for git_args in git_steps:
+            result = _run_git_command(git_args)
+            if result.returncode != 0:
+                raise GitCommandError(
+                    f"git {git_args[0]}", _GIT_OUTPUT_ABOVE, result.returncode
+                )
+
+        # Only a branch without an upstream is pushed to origin explicitly;
+        # an existing upstream (whatever its remote or name) is left alone
+        push_args = ["push"] if has_upstream else ["push", "--set-upstream", "origin", "HEAD"]
+        result = _run_git_command(push_args)
+        if result.returncode != 0:
+            raise GitPushError(_GIT_OUTPUT_ABOVE)
 
         print_success("Synced!")
         return 0
 
+    except GitError as e:
+        print_error(e.message, e.hint)
+        return 1
     except Exception as e:
         print_error(f"Git error: {e}")
         return 1
@@ -316,20 +457,71 @@ def cmd_sync(args: List[str]):
 def cmd_pull():
     """Git pull command."""
     try:
-        subprocess.run(["git", "pull"], cwd=BASE_DIR)
+        result = _run_git_command(["pull"])
+        if result.returncode != 0:
+            raise GitPullError(_GIT_OUTPUT_ABOVE)
         print_success("Pull complete")
         return 0
+    except GitError as e:
+        print_error(e.message, e.hint)
+        return 1
     except Exception as e:
         print_error(f"Git error: {e}")
         return 1
 
 
+def cmd_help(args: List[str]):
+    """Help command."""
+    print_help()
+    return 0
+
+
+# Command name -> handler taking the remaining args (aliases share a handler)
+_DISPATCH: Dict[str, Callable[[List[str]], int]] = {
+    "calendar": lambda args: cmd_calendar(),
+    "hours": cmd_hours,
+    "h": cmd_hours,
+    "log": cmd_hours,
+    "plan": cmd_plan,
+    "plan:status": lambda args: cmd_plan_status(),
+    "plan:stop": lambda args: cmd_plan_stop(),
+    "sync": cmd_sync,
+    "pull": lambda args: cmd_pull(),
+    "help": cmd_help,
+    "--help": cmd_help,
+    "-h": cmd_help,
+}
+
+
+# Error type -> message prefix; looked up along the exception's MRO
+_ERROR_LABELS: Dict[type, str] = {
+    ValidationError: "Validation error",
+    DataNotFoundError: "File not found",
+    DataCorruptedError: "Data corrupted",
+    DataWriteError: "Write error",
+    DataError: "Data error",
+    CalendarError: "Calendar error",
+    GitError: "Git error",
+    StudyTrackerError: "Error",
+}
+
+
+def _error_label(error: StudyTrackerError) -> str:
+    """Get the message prefix for the most specific known error type."""
+    for cls in type(error).__mro__:
+        if cls in _ERROR_LABELS:
+            return _ERROR_LABELS[cls]
+    return "Error"
+
+
 def main():
     args = sys.argv[1:]
 
-    if "--no-color" in args:
+    try:
+        args.remove("--no-color")
         Colors.disable()
-        args = [a for a in args if a != "--no-color"]
+    except ValueError:
+        pass
 
     if len(args) < 1:
         print_help()
@@ -338,45 +530,39 @@ def main():
     cmd = args[0].lower()
     cmd_args = args[1:]
 
-    try:
-        if cmd == "calendar":
-            return cmd_calendar()
-
-        elif cmd in ("hours", "h", "log"):
-            return cmd_hours(cmd_args)
-
-        elif cmd == "plan":
-            return cmd_plan(cmd_args)
+    handler = _DISPATCH.get(cmd)
 
-        elif cmd == "plan:status":
-            return cmd_plan_status()
-
-        elif cmd == "plan:stop":
-            return cmd_plan_stop()
-
-        elif cmd == "sync":
-            return cmd_sync(cmd_args)
-
-        elif cmd == "pull":
-            return cmd_pull()
+    try:
+        if handler is not None:
+            return handler(cmd_args)
 
-        elif cmd in ("help", "--help", "-h"):
-            print_help()
-            return 0
-
-        else:
-            # Pass through to Taskwarrior
-            print(dim(f"Passing to Taskwarrior: task {' '.join(args)}"))
-            return subprocess.run(["task"] + args).returncode
+        # Pass through to Taskwarrior
+        print(dim(f"Passing to Taskwarrior: task {' '.join(args)}"))
+        return subprocess.run(["task"] + args).returncode
 
     except KeyboardInterrupt:
         print("\nCancelled")
         return 130
 
+    except StudyTrackerError as e:
+        print_error(f"{_error_label(e)}: {e.message}", e.hint)
+        return 1
+
     except Exception as e:
-        print_error(f"Error: {e}")
+        if os.environ.get("STUDY_DEBUG"):
+            print_error(f"Unexpected error: {e!r}")
+            import traceback
+
+            traceback.print_exc()
+        else:
+            print_error(
+                f"Unexpected error: {e!r}", "Set STUDY_DEBUG=1 for a full traceback"
+            )
         return 1
 
 
+# Only for 'python -m src.cli' (what scripts/study runs). Running the file
+# directly ('python src/cli.py') is not supported: the src package would not
+# be importable. Installed copies use the 'study' entry point instead.
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,9 +3,14 @@ Configuration management for study tracker.
 """
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
 # Base directory (can be overridden by env var)
-BASE_DIR = Path(os.environ.get('STUDY_DIR', Path(__file__).parent.parent))
+BASE_DIR = Path(
+    os.environ.get('STUDY_DIR')
+    or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 
 # Data files
 DATA_DIR = BASE_DIR
@@ -16,29 +21,34 @@ BACKUP_DIR = BASE_DIR / "backups"
 # Generated files
 DEADLINES_PATH = DATA_DIR / "deadlines.md"
 WEEKLY_SCHEDULE_PATH = DATA_DIR / "weekly_schedule.md"
+GENERATE_CACHE_PATH = DATA_DIR / ".generate_cache"
 
-# Ensure backup directory exists
-BACKUP_DIR.mkdir(exist_ok=True)
 
-# Course aliases (short codes)
-COURSE_ALIASES = {
+def ensure_backup_dir() -> Path:
+    """Create the backup directory if needed (only on paths that write backups)."""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    return BACKUP_DIR
+
+
+# Course aliases (short codes); read-only so callers can share them safely
+COURSE_ALIASES = MappingProxyType({
     'pc': 'ELEC70028',
     'do': 'ELEC70082',
     'cv': 'ELEC70073',
     'ao': 'ELEC70066',
-}
+})
 
 # Reverse lookup
 ALIAS_TO_CODE = COURSE_ALIASES
-CODE_TO_ALIAS = {v: k for k, v in COURSE_ALIASES.items()}
+CODE_TO_ALIAS = MappingProxyType({v: k for k, v in COURSE_ALIASES.items()})
 
 # Course names
-COURSE_NAMES = {
+COURSE_NAMES = MappingProxyType({
     'ELEC70028': 'Predictive Control',
     'ELEC70082': 'Distributed Optimisation and Learning',
     'ELEC70073': 'Computer Vision and Pattern Recognition',
     'ELEC70066': 'Applied Advanced Optimisation',
-}
+})
 
 # Valid statuses
 VALID_STATUSES = frozenset([
@@ -50,5 +60,34 @@ VALID_STATUSES = frozenset([
     'ongoing',
 ])
 
+# Status aliases -> canonical status (canonical names map to themselves)
+STATUS_ALIAS_MAP = MappingProxyType({
+    'done': 'completed',
+    'finish': 'completed',
+    'finished': 'completed',
+    'complete': 'completed',
+    'submit': 'submitted',
+    'sent': 'submitted',
+    'turned_in': 'submitted',
+    'started': 'in_progress',
+    'working': 'in_progress',
+    'wip': 'in_progress',
+    'inprogress': 'in_progress',
+    'in-progress': 'in_progress',
+    'todo': 'not_started',
+    'pending': 'not_started',
+    'notstarted': 'not_started',
+    'not-started': 'not_started',
+    'late': 'overdue',
+    'missed': 'overdue',
+    **{s: s for s in VALID_STATUSES},
+})
+
+
+def normalize_status(status: str) -> Optional[str]:
+    """Map a status or alias to its canonical status, or None if unknown."""
+    return STATUS_ALIAS_MAP.get(status.lower().strip())
+
+
 # Backup settings
 MAX_BACKUPS = 10  # Keep last N backups
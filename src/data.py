@@ -8,12 +8,16 @@ Provides:
 - Detailed error messages for troubleshooting
 """
 
+import errno
 import json
 import os
 import shutil
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 from .config import (
     TRACKER_PATH,
@@ -22,7 +26,9 @@ from .config import (
     MAX_BACKUPS,
     COURSE_NAMES,
     CODE_TO_ALIAS,
+    ensure_backup_dir,
 )
+from .validation import validate_tracker_data
 from .errors import (
     DataError,
     DataNotFoundError,
@@ -32,11 +38,68 @@ from .errors import (
     ValidationError,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw):
+    """
+    Parse JSON from str or bytes, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to catch the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data, pretty: bool = True, default=None) -> bytes:
+    """
+    Serialize data as UTF-8 JSON.
+
+    For plain JSON data (dicts, lists, str, 64-bit ints, bool, None and
+    floats written without an exponent) the bytes match
+    json.dumps(ensure_ascii=False) with either indent=2 (pretty) or
+    separators=(",", ":") (compact). With orjson installed:
+
+    - floats needing an exponent are formatted differently (1e-7, 1e16
+      rather than 1e-07, 1e+16); the values parse back the same
+    - NaN and Infinity are written as null rather than NaN/Infinity
+    - ints outside the 64-bit range raise TypeError
+    - dataclasses and UUIDs are serialized natively, bypassing default
+
+    datetime, date and time objects are always passed to default (when one
+    is given), so default=str gives the same text with either backend.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=default, option=option)
+    if pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=default)
+    return text.encode("utf-8")
+
+
+# (directory, required MB) -> (checked_at, result); see _check_disk_space
+_disk_space_cache: Dict[Tuple[str, int], Tuple[float, bool]] = {}
+DISK_SPACE_CACHE_TTL = 5.0  # seconds
+
 
 def _check_disk_space(path: Path, required_bytes: int = 1024 * 1024) -> bool:
     """
     Check if there's enough disk space for a write operation.
 
+    Results are cached for DISK_SPACE_CACHE_TTL seconds so rapid successive
+    saves don't re-query the filesystem.
+
     Args:
         path: Path where we want to write
         required_bytes: Minimum required space in bytes (default 1MB)
@@ -44,29 +107,183 @@ def _check_disk_space(path: Path, required_bytes: int = 1024 * 1024) -> bool:
     Returns:
         True if enough space available
     """
+    key = (str(path.parent), required_bytes >> 20)
+    now = time.monotonic()
+    cached = _disk_space_cache.get(key)
+    if cached is not None and now - cached[0] < DISK_SPACE_CACHE_TTL:
+        return cached[1]
+
     try:
-        stat = os.statvfs(path.parent)
-        available = stat.f_frsize * stat.f_bavail
-        return available >= required_bytes
-    except (OSError, AttributeError):
-        # statvfs not available on all platforms, assume ok
+        result = shutil.disk_usage(path.parent).free >= required_bytes
+    except OSError:
+        # Can't determine free space, assume ok
         return True
 
+    _disk_space_cache[key] = (now, result)
+    return result
+
+
+def durable_fsync(fd: int) -> None:
+    """
+    Flush a file descriptor all the way to stable storage.
+
+    On macOS fsync() only hands data to the drive, which may keep it in its
+    write cache; F_FULLFSYNC asks the drive to flush that cache too.
+
+    Args:
+        fd: Open file descriptor to flush
+    """
+    if sys.platform == "darwin":
+        import fcntl
+
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass  # Some filesystems reject F_FULLFSYNC; fall back to fsync
+    os.fsync(fd)
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush a directory entry to disk after an atomic rename.
+
+    Without this, a crash shortly after the rename can lose the new
+    directory entry even though the file contents were fsynced.
+
+    Args:
+        directory: Directory containing the renamed file
+    """
+    try:
+        dir_fd = os.open(str(directory), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return  # Directories can't be opened on all platforms (Windows)
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass  # Best effort
+    finally:
+        os.close(dir_fd)
+
+
+# O_TMPFILE creates an unnamed inode in a directory (Linux 3.11+); cleared
+# at runtime if linking it into place turns out not to work here
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0) if sys.platform.startswith("linux") else 0
 
-def _check_write_permission(path: Path) -> bool:
+
+def _write_anonymous(directory: Path, temp_path: Path, content: bytes) -> bool:
     """
-    Check if we can write to a path.
+    Write content to an unnamed O_TMPFILE inode, then link it at temp_path.
+
+    The file only gets a name once it is complete and fsynced, so a crash
+    mid-write leaves nothing behind in the directory.
 
     Args:
-        path: Path to check
+        directory: Directory to create the file in
+        temp_path: Name to link the finished file under
+        content: Bytes to write
 
     Returns:
-        True if writable
+        False if O_TMPFILE (or linking via /proc/self/fd) isn't available and
+        nothing was written, so the caller should fall back to a named file
+    """
+    global _O_TMPFILE
+    if not _O_TMPFILE:
+        return False
+    try:
+        fd = os.open(os.fspath(directory), os.O_WRONLY | _O_TMPFILE, 0o666)
+    except OSError:
+        return False  # Kernel or filesystem without O_TMPFILE support
+
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+        durable_fsync(fd)
+
+        proc_path = f"/proc/self/fd/{fd}"
+        try:
+            try:
+                os.link(proc_path, temp_path)
+            except FileExistsError:
+                os.unlink(temp_path)  # Left over from an interrupted save
+                os.link(proc_path, temp_path)
+        except OSError:
+            # No /proc, or a sandbox that refuses the link (EXDEV/EPERM)
+            _O_TMPFILE = 0
+            return False
+    finally:
+        os.close(fd)
+    return True
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """
+    Atomically replace a file's contents.
+
+    Writes to '<path>.tmp', fsyncs it, renames it over path and fsyncs the
+    directory. On Linux the temp file is built as an anonymous O_TMPFILE
+    inode and only linked in once complete.
+
+    Args:
+        path: Destination file path
+        content: Bytes to write
+
+    Raises:
+        DataWriteError: If the write or rename fails
+    """
+    temp_path = Path(os.fspath(path) + ".tmp")
+
+    try:
+        if not _write_anonymous(path.parent, temp_path, content):
+            with open(temp_path, "wb") as f:
+                f.write(content)
+                f.flush()
+                durable_fsync(f.fileno())  # Ensure data is written to disk
+    except PermissionError:
+        raise DataWriteError(str(temp_path), "Permission denied")
+    except OSError as e:
+        # Only look at free space once a write has actually failed
+        if e.errno == errno.ENOSPC or not _check_disk_space(path):
+            raise DataWriteError(str(temp_path), "Insufficient disk space")
+        raise DataWriteError(str(temp_path), str(e))
+
+    # Atomic rename; os.replace also overwrites an existing target on Windows
+    try:
+        os.replace(temp_path, path)
+    except OSError as e:
+        # Clean up temp file if rename fails
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        if e.errno not in (errno.EXDEV, errno.EBUSY):
+            raise DataWriteError(str(path), f"Failed to rename temp file: {e}")
+        # The target is a mount point of its own (e.g. a single-file bind
+        # mount in a container) and can't be renamed over; the best we can
+        # do is rewrite it in place
+        _overwrite_in_place(path, content)
+        return
+
+    fsync_directory(path.parent)
+
+
+def _overwrite_in_place(path: Path, content: bytes) -> None:
+    """
+    Rewrite a file's contents in place and fsync it (not atomic).
+
+    Raises:
+        DataWriteError: If the write fails
     """
-    if path.exists():
-        return os.access(path, os.W_OK)
-    # Check parent directory
-    return os.access(path.parent, os.W_OK)
+    try:
+        with open(path, "wb") as f:
+            f.write(content)
+            f.flush()
+            durable_fsync(f.fileno())
+    except PermissionError:
+        raise DataWriteError(str(path), "Permission denied")
+    except OSError as e:
+        raise DataWriteError(str(path), str(e))
 
 
 def _create_backup(file_path: Path) -> Optional[Path]:
@@ -87,7 +304,7 @@ def _create_backup(file_path: Path) -> Optional[Path]:
 
     # Ensure backup directory exists
     try:
-        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_backup_dir()
     except PermissionError:
         raise DataWriteError(
             str(BACKUP_DIR), "Cannot create backup directory - permission denied"
@@ -127,16 +344,23 @@ def _cleanup_old_backups(prefix: str) -> int:
     Returns:
         Number of backups deleted
     """
-    backups = sorted(
-        BACKUP_DIR.glob(f"{prefix}_*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    start = prefix + "_"
+    backups = []
+    with os.scandir(BACKUP_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(start) and name.endswith(".json")):
+                continue
+            try:
+                backups.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue  # Vanished since the directory was read
+    backups.sort(reverse=True)
 
     deleted = 0
-    for old_backup in backups[MAX_BACKUPS:]:
+    for _, old_backup in backups[MAX_BACKUPS:]:
         try:
-            old_backup.unlink()
+            os.unlink(old_backup)
             deleted += 1
         except OSError:
             pass  # Ignore cleanup errors
@@ -144,64 +368,41 @@ def _cleanup_old_backups(prefix: str) -> int:
     return deleted
 
 
-def validate_tracker_data(data: dict) -> Tuple[bool, List[str]]:
-    """
-    Validate entire tracker data structure.
+# Identity of the tracker file as last written (or restored) by this process
+# after validation; a load that finds the same file can skip re-validating it
+_validated_stamp: Optional[Tuple[int, int, int]] = None
 
-    Args:
-        data: Tracker data dict
+# Last tracker returned by load_tracker(shared=True), keyed by the path and
+# stamp it was read from; read-only callers in one process reuse it
+_shared_tracker: Optional[Tuple[Tuple[Path, Tuple[int, int, int]], dict]] = None
 
-    Returns:
-        Tuple of (is_valid, list of errors)
-    """
-    from .config import VALID_STATUSES
 
-    errors = []
-
-    if not isinstance(data, dict):
-        errors.append("Tracker data must be a dictionary")
-        return False, errors
-
-    if "courses" not in data:
-        errors.append("Missing 'courses' key in tracker data")
-        return False, errors
-
-    if not isinstance(data["courses"], dict):
-        errors.append("'courses' must be a dictionary")
-        return False, errors
-
-    for code, course in data["courses"].items():
-        if code not in COURSE_NAMES:
-            errors.append(f"Unknown course code: {code}")
-
-        if not isinstance(course, dict):
-            errors.append(f"Course {code} must be a dictionary")
-            continue
-
-        if "assessments" not in course:
-            errors.append(f"Missing 'assessments' for course {code}")
-            continue
-
-        if not isinstance(course["assessments"], dict):
-            errors.append(f"'assessments' for {code} must be a dictionary")
-            continue
-
-        for key, assessment in course["assessments"].items():
-            if not isinstance(assessment, dict):
-                errors.append(f"Assessment {code}/{key} must be a dictionary")
-                continue
+def _file_stamp(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identify a file version by inode, mtime and size."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
 
-            status = assessment.get("status", "")
-            if status and status not in VALID_STATUSES:
-                errors.append(f"Invalid status '{status}' for {code}/{key}")
 
-    return len(errors) == 0, errors
+def _remember_validated(path: Path) -> None:
+    """Record that the file at path holds validated data we just wrote."""
+    global _validated_stamp, _shared_tracker
+    _shared_tracker = None
+    try:
+        _validated_stamp = _file_stamp(path.stat())
+    except OSError:
+        _validated_stamp = None
 
 
-def load_tracker() -> dict:
+def load_tracker(validate: bool = True, shared: bool = False) -> dict:
     """
     Load tracker data with validation.
 
+    Args:
+        validate: Whether to validate the data structure
+        shared: Return the dict from the previous shared load if the file
+            is unchanged since. The caller must treat it as read-only, since
+            later shared loads get the same object; callers that modify and
+            save the data must load their own copy
+
     Returns:
         Tracker data dict
 
@@ -210,25 +411,32 @@ def load_tracker() -> dict:
         DataCorruptedError: If file cannot be parsed
         DataValidationError: If data structure is invalid
     """
-    if not TRACKER_PATH.exists():
-        raise DataNotFoundError(str(TRACKER_PATH), "Tracker file")
+    global _shared_tracker
 
-    # Check if file is readable
-    if not os.access(TRACKER_PATH, os.R_OK):
-        raise DataError(
-            f"Cannot read tracker file: {TRACKER_PATH}", hint="Check file permissions"
-        )
+    if shared and _shared_tracker is not None:
+        try:
+            key = (TRACKER_PATH, _file_stamp(os.stat(TRACKER_PATH)))
+        except OSError:
+            key = None  # let open() below report the problem
+        if key == _shared_tracker[0]:
+            return _shared_tracker[1]
 
+    # Missing or unreadable files are reported by open() itself rather than
+    # by separate exists()/access() checks
     try:
-        with open(TRACKER_PATH, "r", encoding="utf-8") as f:
-            content = f.read()
-            if not content.strip():
-                raise DataCorruptedError(str(TRACKER_PATH), "File is empty")
-            data = json.loads(content)
+        # Parse the raw bytes directly; both json and orjson accept UTF-8 bytes
+        with open(TRACKER_PATH, "rb") as f:
+            stamp = _file_stamp(os.fstat(f.fileno()))
+            raw = f.read()
+        if not raw or raw.isspace():
+            raise DataCorruptedError(str(TRACKER_PATH), "File is empty")
+        data = _json_loads(raw)
     except json.JSONDecodeError as e:
         raise DataCorruptedError(str(TRACKER_PATH), str(e))
     except UnicodeDecodeError as e:
         raise DataCorruptedError(str(TRACKER_PATH), f"Invalid encoding: {e}")
+    except FileNotFoundError:
+        raise DataNotFoundError(str(TRACKER_PATH), "Tracker file")
     except PermissionError:
         raise DataError(
             f"Permission denied reading: {TRACKER_PATH}", hint="Check file permissions"
@@ -236,24 +444,41 @@ def load_tracker() -> dict:
     except OSError as e:
         raise DataError(f"Cannot read file: {e}")
 
-    # Validate structure
-    is_valid, errors = validate_tracker_data(data)
-    if not is_valid:
-        raise DataValidationError(errors)
+    # Validate structure (unless this is the file we just saved ourselves)
+    if validate and stamp != _validated_stamp:
+        is_valid, errors = validate_tracker_data(data)
+        if not is_valid:
+            raise DataValidationError(errors)
+
+    # Only share data that has been through validation
+    if shared and (validate or stamp == _validated_stamp):
+        _shared_tracker = ((TRACKER_PATH, stamp), data)
 
     return data
 
 
-def save_tracker(data: dict, create_backup: bool = True) -> Path:
+def save_tracker(
+    data: dict,
+    create_backup: bool = True,
+    pretty: bool = False,
+    history_entry: Optional[dict] = None,
+) -> Path:
     """
     Save tracker data with optional backup.
 
     Uses atomic write pattern: write to temp file, then rename.
     This prevents data corruption if the write is interrupted.
+    If data serializes to exactly what is already on disk, nothing is
+    written and no backup is made.
 
     Args:
         data: Tracker data to save
         create_backup: Whether to create a backup first
+        pretty: Indent the JSON for readable diffs; compact by default,
+            which roughly halves the bytes written and parsed back
+        history_entry: Undo history entry describing this change; it is
+            appended only once the tracker has been saved, so a failed save
+            never leaves an entry for a change that didn't happen
 
     Returns:
         Path to saved file
@@ -267,46 +492,46 @@ def save_tracker(data: dict, create_backup: bool = True) -> Path:
     if not is_valid:
         raise DataValidationError(errors)
 
-    # Check disk space
-    if not _check_disk_space(TRACKER_PATH):
-        raise DataWriteError(str(TRACKER_PATH), "Insufficient disk space")
-
-    # Check write permission
-    if not _check_write_permission(TRACKER_PATH):
-        raise DataWriteError(str(TRACKER_PATH), "Permission denied")
+    try:
+        current: Optional[bytes] = TRACKER_PATH.read_bytes()
+    except OSError:
+        current = None
+
+    # Stamp and serialize once. The result is compared with the file after
+    # putting the previous timestamp back, so a save that changes nothing
+    # skips the backup and the write.
+    previous = data.get("last_updated")
+    data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    content = _json_dumps(data, pretty)
+    if current is not None and isinstance(previous, str):
+        sep = ": " if pretty else ":"
+        stamped = b'"last_updated"%s%s' % (sep.encode(), _json_dumps(data["last_updated"]))
+        unstamped = b'"last_updated"%s%s' % (sep.encode(), _json_dumps(previous))
+        if content.replace(stamped, unstamped, 1) == current:
+            data["last_updated"] = previous
+            _remember_validated(TRACKER_PATH)
+            _record_history(history_entry)
+            return TRACKER_PATH
+
+    # No up-front space or permission checks: they race with the filesystem
+    # anyway, and atomic_write_bytes turns the real failure into DataWriteError
 
     # Create backup
-    if create_backup and TRACKER_PATH.exists():
+    if create_backup and current is not None:
         _create_backup(TRACKER_PATH)
 
-    # Update timestamp
-    data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    atomic_write_bytes(TRACKER_PATH, content)
+    _remember_validated(TRACKER_PATH)
+    _record_history(history_entry)
 
-    # Write to temp file first, then rename (atomic operation)
-    temp_path = TRACKER_PATH.with_suffix(".tmp")
+    return TRACKER_PATH
 
-    try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.flush()
-            os.fsync(f.fileno())  # Ensure data is written to disk
-    except PermissionError:
-        raise DataWriteError(str(temp_path), "Permission denied")
-    except OSError as e:
-        raise DataWriteError(str(temp_path), str(e))
 
-    # Atomic rename
-    try:
-        temp_path.rename(TRACKER_PATH)
-    except OSError as e:
-        # Clean up temp file if rename fails
-        try:
-            temp_path.unlink()
-        except OSError:
-            pass
-        raise DataWriteError(str(TRACKER_PATH), f"Failed to rename temp file: {e}")
+def _record_history(entry: Optional[dict]) -> None:
+    if entry is not None:
+        from .history import record_entry
 
-    return TRACKER_PATH
+        record_entry(entry)
 
 
 def load_courses() -> dict:
@@ -324,10 +549,12 @@ def load_courses() -> dict:
         raise DataNotFoundError(str(COURSES_PATH), "Courses file")
 
     try:
-        with open(COURSES_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(COURSES_PATH, "rb") as f:
+            return _json_loads(f.read())
     except json.JSONDecodeError as e:
         raise DataCorruptedError(str(COURSES_PATH), str(e))
+    except UnicodeDecodeError as e:
+        raise DataCorruptedError(str(COURSES_PATH), f"Invalid encoding: {e}")
     except PermissionError:
         raise DataError(
             f"Permission denied reading: {COURSES_PATH}", hint="Check file permissions"
@@ -336,6 +563,39 @@ def load_courses() -> dict:
         raise DataError(f"Cannot read file: {e}")
 
 
+# Deadline values that aren't dates
+NO_DEADLINE = frozenset({"", "TBD", "ongoing"})
+
+
+@lru_cache(maxsize=None)
+def parse_deadline(deadline: str) -> Optional[datetime]:
+    """
+    Parse an assessment deadline string.
+
+    Shared by the tracker views and deadlines.md so they agree on which
+    assessments have a deadline. For ranges like "2026-03-16 to 2026-03-20"
+    the start date is used.
+    The cache is unbounded (no LRU bookkeeping on hits); it only ever holds
+    the handful of distinct deadline strings in the tracker.
+
+    Returns:
+        The deadline as a datetime, or None for "", "TBD", "ongoing" or
+        anything unparseable
+    """
+    if deadline in NO_DEADLINE or deadline is None:
+        return None
+    if " to " in deadline:
+        deadline = deadline.split(" to ")[0]
+    try:
+        # Canonical YYYY-MM-DD goes through the C ISO parser; anything else
+        # (e.g. unpadded "2026-3-5") keeps strptime's more lenient rules
+        if len(deadline) == 10 and deadline[4] == "-" and deadline[7] == "-":
+            return datetime.fromisoformat(deadline)
+        return datetime.strptime(deadline, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 def get_course_display_name(code: str) -> str:
     """Get display name with alias for a course code."""
     alias = CODE_TO_ALIAS.get(code, "??")
@@ -350,24 +610,30 @@ def list_backups() -> List[dict]:
     Returns:
         List of backup info dicts, sorted by most recent first
     """
-    if not BACKUP_DIR.exists():
+    backups = []
+    try:
+        # scandir yields entries from one directory read; is_file() uses d_type
+        with os.scandir(BACKUP_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # Skip files we can't stat
+                    continue
+                backups.append(
+                    {
+                        "path": BACKUP_DIR / entry.name,
+                        "name": entry.name,
+                        "size": stat.st_size,
+                        "modified": datetime.fromtimestamp(stat.st_mtime),
+                    }
+                )
+    except FileNotFoundError:
         return []
 
-    backups = []
-    for backup in sorted(BACKUP_DIR.glob("*.json"), reverse=True):
-        try:
-            stat = backup.stat()
-            backups.append(
-                {
-                    "path": backup,
-                    "name": backup.name,
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime),
-                }
-            )
-        except OSError:
-            # Skip files we can't stat
-            continue
+    backups.sort(key=lambda b: b["modified"], reverse=True)
     return backups
 
 
@@ -397,13 +663,16 @@ def restore_backup(backup_name: str) -> Path:
 
     # Validate the backup before restoring
     try:
-        with open(backup_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(backup_path, "rb") as f:
+            raw = f.read()
+        data = _json_loads(raw)
         is_valid, errors = validate_tracker_data(data)
         if not is_valid:
             raise DataValidationError(errors)
     except json.JSONDecodeError as e:
         raise DataCorruptedError(str(backup_path), str(e))
+    except UnicodeDecodeError as e:
+        raise DataCorruptedError(str(backup_path), f"Invalid encoding: {e}")
 
     # Backup current before restore
     if TRACKER_PATH.exists():
@@ -416,6 +685,8 @@ def restore_backup(backup_name: str) -> Path:
     except OSError as e:
         raise DataWriteError(str(TRACKER_PATH), str(e))
 
+    _remember_validated(TRACKER_PATH)
+
     return TRACKER_PATH
 
 
@@ -426,6 +697,7 @@ __all__ = [
     "save_tracker",
     "load_courses",
     "get_course_display_name",
+    "parse_deadline",
     "list_backups",
     "restore_backup",
     "validate_tracker_data",
@@ -7,23 +7,55 @@ Provides safe file generation with:
 - Validation of generated content
 """
 
+import io
+import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
-
-from .config import DEADLINES_PATH, COURSE_NAMES, CODE_TO_ALIAS
-from .data import load_tracker
+from typing import List, Optional, Tuple, Union
+
+from .config import (
+    DEADLINES_PATH,
+    GENERATE_CACHE_PATH,
+    TRACKER_PATH,
+    COURSE_NAMES,
+    CODE_TO_ALIAS,
+)
+from .data import load_tracker, atomic_write_bytes, parse_deadline
 from .errors import DataError, DataWriteError
 
-
-def _safe_write_file(path: Path, content: str) -> Path:
+# Status labels used in the deadlines table and the per-course summary
+_STATUS_DISPLAY = {
+    "not_started": "⬜ Not started",
+    "in_progress": "🔄 In progress",
+    "completed": "✅ Completed",
+    "submitted": "📤 Submitted",
+    "overdue": "🔴 Overdue",
+}
+
+_STATUS_EMOJI = {
+    "not_started": "⬜",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "submitted": "📤",
+    "overdue": "🔴",
+    "ongoing": "🔁",
+}
+
+# Same as strftime("%b") in the C locale, without going through strftime
+_MONTH_ABBRS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+def _safe_write_file(path: Path, content: Union[str, bytes]) -> Path:
     """
     Safely write content to a file using atomic write pattern.
 
     Args:
         path: Destination file path
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8)
 
     Returns:
         Path to written file
@@ -49,28 +81,10 @@ def _safe_write_file(path: Path, content: str) -> Path:
     if not path.exists() and not os.access(path.parent, os.W_OK):
         raise DataWriteError(str(path), "Cannot write to directory - permission denied")
 
-    # Write to temp file first
-    temp_path = path.with_suffix(".tmp")
+    if isinstance(content, str):
+        content = content.encode("utf-8")
 
-    try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
-    except PermissionError:
-        raise DataWriteError(str(temp_path), "Permission denied")
-    except OSError as e:
-        raise DataWriteError(str(temp_path), str(e))
-
-    # Atomic rename
-    try:
-        temp_path.rename(path)
-    except OSError as e:
-        try:
-            temp_path.unlink()
-        except OSError:
-            pass
-        raise DataWriteError(str(path), f"Failed to rename temp file: {e}")
+    atomic_write_bytes(path, content)
 
     return path
 
@@ -86,144 +100,182 @@ def generate_deadlines_md() -> Path:
         DataError: If tracker data cannot be loaded
         DataWriteError: If file cannot be written
     """
-    data = load_tracker()
+    data = load_tracker(shared=True)
     today = datetime.now()
 
-    lines = [
-        "# Assessment Deadlines Overview",
-        "",
-        f"**Generated:** {today.strftime('%Y-%m-%d %H:%M')}",
-        "",
-        "> This file is auto-generated from tracker.json. Do not edit manually.",
-        "> Run `study generate` to regenerate.",
-        "",
-        "## Upcoming Deadlines",
-        "",
-    ]
-
-    # Collect all deadlines
-    deadlines = []
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        "# Assessment Deadlines Overview\n"
+        "\n"
+        f"**Generated:** {today.strftime('%Y-%m-%d %H:%M')}\n"
+        "\n"
+        "> This file is auto-generated from tracker.json. Do not edit manually.\n"
+        "> Run `study generate` to regenerate.\n"
+        "\n"
+        "## Upcoming Deadlines\n"
+        "\n"
+    )
+
+    # Single pass over the courses: collect the dated deadlines as parallel
+    # lists and build the per-course summary alongside them.
+    dl_dates: List[datetime] = []
+    dl_strs: List[str] = []
+    dl_codes: List[str] = []
+    dl_names: List[str] = []
+    dl_statuses: List[str] = []
+    dl_weights: List[str] = []
+    summary = io.StringIO()
+
     for code, course in data["courses"].items():
+        alias = CODE_TO_ALIAS.get(code, "??")
+        summary.write(f"\n### [{alias}] {COURSE_NAMES.get(code, code)}\n\n")
+
+        total = 0
+        completed = 0
         for key, assessment in course["assessments"].items():
-            deadline = assessment.get("deadline", "")
-            status = assessment.get("status", "not_started")
+            total += 1
+            status = assessment.get("status", "")
+            if status in ("completed", "submitted"):
+                completed += 1
 
-            if not deadline or deadline in ("TBD", "ongoing"):
-                continue
+            status_emoji = _STATUS_EMOJI.get(status, "❓")
 
-            try:
-                # Handle date range
-                dl_str = deadline.split(" to ")[0] if " to " in deadline else deadline
-                dl_date = datetime.strptime(dl_str, "%Y-%m-%d")
-                deadlines.append(
-                    {
-                        "date": dl_date,
-                        "deadline_str": deadline,
-                        "code": code,
-                        "key": key,
-                        "name": assessment["name"],
-                        "status": status,
-                        "weight": assessment.get("weight", ""),
-                    }
-                )
-            except (ValueError, KeyError):
-                # Skip entries with invalid dates or missing name
-                continue
+            weight = assessment.get("weight", "")
+            weight_str = f" ({weight})" if weight else ""
+            summary.write(
+                f"- {status_emoji} **{assessment.get('name', key)}**{weight_str}"
+                f" — {assessment.get('deadline', 'TBD')}\n"
+            )
 
-    deadlines.sort(key=lambda x: x["date"])
+            if "name" not in assessment:
+                continue
+            # Same parser as the tracker views, so both agree on which
+            # assessments have a deadline (ranges use their start date)
+            deadline = assessment.get("deadline", "")
+            dl_date = parse_deadline(deadline)
+            if dl_date is None:
+                continue
 
-    # Group by month
-    current_month: Optional[str] = None
-    for dl in deadlines:
-        month = dl["date"].strftime("%B %Y")
+            dl_dates.append(dl_date)
+            dl_strs.append(deadline)
+            dl_codes.append(code)
+            dl_names.append(assessment["name"])
+            dl_statuses.append(assessment.get("status", "not_started"))
+            dl_weights.append(weight)
+
+        summary.write(f"\nProgress: {completed}/{total} completed\n")
+
+    # Alias and truncated name per course, looked up once rather than per row
+    course_display = {
+        code: (CODE_TO_ALIAS.get(code, "??"), (COURSE_NAMES.get(code) or code)[:20])
+        for code in data["courses"]
+    }
+
+    # Group by month (rows are date-sorted, so each month is formatted once)
+    current_month: Optional[Tuple[int, int]] = None
+    for i in sorted(range(len(dl_dates)), key=dl_dates.__getitem__):
+        dl_date = dl_dates[i]
+        dl_status = dl_statuses[i]
+        month = (dl_date.year, dl_date.month)
         if month != current_month:
             current_month = month
-            lines.append(f"### {month}")
-            lines.append("")
-            lines.append("| Date | Time | Course | Assessment | Weight | Status |")
-            lines.append("|------|------|--------|------------|--------|--------|")
+            write(
+                f"### {dl_date.strftime('%B %Y')}\n"
+                "\n"
+                "| Date | Time | Course | Assessment | Weight | Status |\n"
+                "|------|------|--------|------------|--------|--------|\n"
+            )
 
-        alias: str = CODE_TO_ALIAS.get(dl["code"], "??")
-        course_name: str = COURSE_NAMES.get(dl["code"]) or dl["code"]
-        date_str = dl["date"].strftime("%d %b")
-        weight = dl["weight"] if dl["weight"] else "-"
+        alias, course_name = course_display[dl_codes[i]]
+        date_str = f"{dl_date.day:02d} {_MONTH_ABBRS[dl_date.month - 1]}"
+        weight = dl_weights[i] or "-"
 
         # Status with emoji
-        status_display = {
-            "not_started": "⬜ Not started",
-            "in_progress": "🔄 In progress",
-            "completed": "✅ Completed",
-            "submitted": "📤 Submitted",
-            "overdue": "🔴 Overdue",
-        }.get(dl["status"], dl["status"])
+        status_display = _STATUS_DISPLAY.get(dl_status, dl_status)
 
         # Check if overdue
-        days_left = (dl["date"] - today).days
-        if days_left < 0 and dl["status"] not in ("completed", "submitted"):
+        days_left = (dl_date - today).days
+        if days_left < 0 and dl_status not in ("completed", "submitted"):
             status_display = f"🔴 OVERDUE ({-days_left}d)"
-        elif days_left <= 3 and dl["status"] not in ("completed", "submitted"):
+        elif days_left <= 3 and dl_status not in ("completed", "submitted"):
             status_display = f"⚠️ {days_left}d left"
 
         # Extract time if present
-        deadline_str = dl["deadline_str"]
+        deadline_str = dl_strs[i]
         time_str = "-"
         if "T" in deadline_str:
             time_str = deadline_str.split("T")[-1]
 
-        lines.append(
+        write(
             f"| {date_str} | {time_str} | "
-            f"[{alias}] {course_name[:20]} | {dl['name']} | {weight} | {status_display} |"
+            f"[{alias}] {course_name} | {dl_names[i]} | {weight} | {status_display} |\n"
         )
 
-    lines.append("")
-
     # Summary by course
-    lines.append("## Summary by Course")
-    lines.append("")
+    write("\n## Summary by Course\n")
+    write(summary.getvalue())
 
-    for code, course in data["courses"].items():
-        alias = CODE_TO_ALIAS.get(code, "??")
-        name = COURSE_NAMES.get(code, code)
-        lines.append(f"### [{alias}] {name}")
-        lines.append("")
+    return _safe_write_file(DEADLINES_PATH, buf.getvalue())
 
-        total = 0
-        completed = 0
-        for key, assessment in course["assessments"].items():
-            total += 1
-            status = assessment.get("status", "")
-            if status in ("completed", "submitted"):
-                completed += 1
 
-            status_emoji = {
-                "not_started": "⬜",
-                "in_progress": "🔄",
-                "completed": "✅",
-                "submitted": "📤",
-                "overdue": "🔴",
-                "ongoing": "🔁",
-            }.get(status, "❓")
+def _generation_stamp() -> Optional[dict]:
+    """
+    Describe the inputs of a generation run.
 
-            deadline = assessment.get("deadline", "TBD")
-            weight = assessment.get("weight", "")
-            weight_str = f" ({weight})" if weight else ""
-            assessment_name = assessment.get("name", key)
+    Output depends on the tracker contents and on today's date (overdue and
+    days-left markers), so both are part of the stamp.
 
-            lines.append(
-                f"- {status_emoji} **{assessment_name}**{weight_str} — {deadline}"
-            )
+    Returns:
+        Stamp dict, or None if the tracker cannot be stat'ed
+    """
+    try:
+        stat = TRACKER_PATH.stat()
+    except OSError:
+        return None
+    return {
+        "tracker_mtime_ns": stat.st_mtime_ns,
+        "tracker_size": stat.st_size,
+        "date": datetime.now().strftime("%Y-%m-%d"),
+    }
+
+
+def _load_cached_outputs(stamp: dict) -> Optional[List[Path]]:
+    """Return previously generated paths if the cache matches stamp and they exist."""
+    try:
+        with open(GENERATE_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get("stamp") != stamp:
+        return None
 
-        lines.append(f"\nProgress: {completed}/{total} completed")
-        lines.append("")
+    paths = [Path(p) for p in cache.get("generated", [])]
+    if not paths or not all(p.exists() for p in paths):
+        return None
+    return paths
 
-    content = "\n".join(lines)
-    return _safe_write_file(DEADLINES_PATH, content)
+
+def _save_generation_cache(stamp: dict, generated: List[Path]) -> None:
+    """Record a successful generation run."""
+    try:
+        with open(GENERATE_CACHE_PATH, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"stamp": stamp, "generated": [str(p) for p in generated]}))
+    except OSError:
+        pass  # Best effort
 
 
-def generate_all() -> List[Path]:
+def generate_all(force: bool = False) -> List[Path]:
     """
     Generate all markdown files from tracker data.
 
+    Skipped, with a notice, when the tracker hasn't changed since the last
+    run on the same day and all outputs still exist.
+
+    Args:
+        force: Regenerate even if the outputs are up to date
+
     Returns:
         List of generated file paths
 
@@ -231,6 +283,13 @@ def generate_all() -> List[Path]:
         DataError: If tracker data cannot be loaded
         DataWriteError: If any file cannot be written
     """
+    stamp = _generation_stamp()
+    if not force and stamp is not None:
+        cached = _load_cached_outputs(stamp)
+        if cached is not None:
+            print("\nGenerated files up to date (cached): tracker.json unchanged today")
+            return cached
+
     generated = []
     errors = []
 
@@ -252,5 +311,7 @@ def generate_all() -> List[Path]:
         print(f"\nWarnings during generation:")
         for err in errors:
             print(f"  - {err}")
+    elif stamp is not None:
+        _save_generation_cache(stamp, generated)
 
     return generated
@@ -2,41 +2,235 @@
 History tracking for undo functionality.
 
 Maintains a history of changes that can be undone.
+
+The history is a JSON-lines file: recording a change appends one line, and
+the file is compacted back to MAX_HISTORY lines once it has grown to twice
+that.
 """
 
-import json
+import atexit
+import mmap
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .config import BASE_DIR
+from .data import _json_dumps, _json_loads
 
-HISTORY_FILE = BASE_DIR / ".study_history.json"
+HISTORY_FILE = BASE_DIR / ".study_history.jsonl"
 MAX_HISTORY = 50
 
+# Name of the history file before it moved to JSON lines
+_LEGACY_NAME = ".study_history.json"
+
+# Month abbreviations for entry timestamps, avoiding strftime per entry
+_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+# In-process copy of the newest entries, the file version it was read from,
+# and how many lines that file holds
+_cache: Optional[List[Dict[str, Any]]] = None
+_cache_key: Optional[Tuple[Path, Optional[int], int, Optional[int]]] = None
+_line_count = 0
+
+# Append-mode descriptor kept open between records, as (path, inode, fd)
+_append_fd: Optional[Tuple[Path, int, int]] = None
+
+
+def _file_key() -> Tuple[Path, Optional[int], int, Optional[int]]:
+    """Identify the current history file version as (path, mtime_ns, size, inode)."""
+    try:
+        st = HISTORY_FILE.stat()
+    except OSError:
+        return (HISTORY_FILE, None, 0, None)
+    return (HISTORY_FILE, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _close_append_fd() -> None:
+    global _append_fd
+    if _append_fd is not None:
+        try:
+            os.close(_append_fd[2])
+        except OSError:
+            pass
+        _append_fd = None
+
+
+atexit.register(_close_append_fd)
+
+
+def _get_append_fd(inode: Optional[int]) -> int:
+    """
+    Return an O_APPEND descriptor for HISTORY_FILE, opening it if needed.
+
+    The descriptor is reopened when the path changes or the file at that
+    path is no longer the inode it was opened on (it was compacted or
+    replaced since).
+    """
+    global _append_fd
+    if _append_fd is not None and _append_fd[:2] == (HISTORY_FILE, inode):
+        return _append_fd[2]
+
+    _close_append_fd()
+    fd = os.open(HISTORY_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    _append_fd = (HISTORY_FILE, os.fstat(fd).st_ino, fd)
+    return fd
+
+
+def _encode(history: List[Dict[str, Any]]) -> bytes:
+    return b"".join(_json_dumps(entry, pretty=False) + b"\n" for entry in history)
+
+
+def _migrate_legacy() -> None:
+    """Move entries from a JSON-array .study_history.json into HISTORY_FILE."""
+    legacy = HISTORY_FILE.with_name(_LEGACY_NAME)
+    if legacy == HISTORY_FILE:
+        return
+    try:
+        raw = legacy.read_bytes()
+    except OSError:
+        return
+
+    # An unreadable legacy file is left in place rather than discarded
+    try:
+        entries = _json_loads(raw)
+    except ValueError:
+        return
+    if not isinstance(entries, list):
+        return
+
+    current, _ = _read_history()
+    if not _save_history(entries + [e for e in current if e not in entries]):
+        return  # Keep the legacy file until its entries are safely written
+    try:
+        legacy.unlink()
+    except OSError:
+        pass
+
+
+def _read_history() -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse the newest MAX_HISTORY entries from the history file.
+
+    Lines are parsed from the end, so older lines awaiting compaction are
+    never decoded.
+
+    Returns:
+        Tuple of (entries oldest first, number of lines in the file)
+    """
+    try:
+        lines = HISTORY_FILE.read_bytes().splitlines()
+    except OSError:
+        return [], 0
+
+    entries: List[Dict[str, Any]] = []
+    for line in reversed(lines):
+        if len(entries) == MAX_HISTORY:
+            break
+        try:
+            entries.append(_json_loads(line))
+        except ValueError:
+            continue  # Torn line from an interrupted append
+    entries.reverse()
+    return entries, len(lines)
+
 
 def _load_history() -> List[Dict[str, Any]]:
-    """Load history from file."""
-    if not HISTORY_FILE.exists():
-        return []
+    """Load history, re-reading the file only if it changed."""
+    global _cache, _cache_key, _line_count
+    if _cache_key is None or _cache_key[0] != HISTORY_FILE:
+        _migrate_legacy()
+
+    key = _file_key()
+    if _cache is None or key != _cache_key:
+        (_cache, _line_count), _cache_key = _read_history(), key
+    return _cache
+
 
+def _save_history(history: List[Dict[str, Any]]) -> bool:
+    """
+    Rewrite the history file with the newest MAX_HISTORY entries.
+
+    Returns:
+        True if the file was written, False if the (best effort) write failed
+    """
+    global _cache, _cache_key, _line_count
+    history = history[-MAX_HISTORY:]
+    temp_path = Path(os.fspath(HISTORY_FILE) + ".tmp")
     try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return []
+        with open(temp_path, "wb") as f:
+            f.write(_encode(history))
+        os.replace(temp_path, HISTORY_FILE)
+    except OSError:
+        _cache = None
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
 
+    _cache, _cache_key, _line_count = history, _file_key(), len(history)
+    return True
+
+
+def _append_history(entry: Dict[str, Any]) -> None:
+    """Append one entry to the history file without rewriting it."""
+    global _cache, _cache_key, _line_count
+    history = _load_history()
+    line = _json_dumps(entry, pretty=False) + b"\n"
 
-def _save_history(history: List[Dict[str, Any]]) -> None:
-    """Save history to file."""
     try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(history[-MAX_HISTORY:], f, indent=2)
+        fd = _get_append_fd(_cache_key[3])
+        os.write(fd, line)
+        size = os.fstat(fd).st_size
     except OSError:
-        pass  # Best effort
+        _close_append_fd()
+        return  # Best effort
 
+    if size != _cache_key[2] + len(line):
+        # Another process wrote in between; re-read next time
+        _cache = None
+        return
 
-def record_change(
+    history.append(entry)
+    del history[:-MAX_HISTORY]
+    _line_count += 1
+    _cache_key = _file_key()
+
+    if _line_count >= 2 * MAX_HISTORY:
+        _save_history(history)
+
+
+def _truncate_last_line(expected_size: int) -> bool:
+    """
+    Cut the final entry off the history file in place.
+
+    Nothing is changed unless the file is still expected_size bytes long and
+    ends with a complete, parseable line.
+
+    Returns:
+        True if the file was truncated
+    """
+    try:
+        with open(HISTORY_FILE, "rb+") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size != expected_size:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[size - 1] != ord("\n"):
+                    return False
+                start = mm.rfind(b"\n", 0, size - 1) + 1
+                _json_loads(mm[start : size - 1])
+            f.truncate(start)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def change_entry(
     action: str,
     course_code: str,
     assessment_key: str,
@@ -44,9 +238,9 @@ def record_change(
     old_value: Any,
     new_value: Any,
     description: Optional[str] = None,
-) -> None:
+) -> Dict[str, Any]:
     """
-    Record a change for potential undo.
+    Build a history entry for an assessment change without recording it.
 
     Args:
         action: Type of action (e.g., 'update_status', 'record_score', 'log_hours')
@@ -56,10 +250,11 @@ def record_change(
         old_value: Previous value
         new_value: New value
         description: Human-readable description of the change
-    """
-    history = _load_history()
 
-    entry = {
+    Returns:
+        Entry dict, ready for record_entry() or save_tracker(history_entry=...)
+    """
+    return {
         "timestamp": datetime.now().isoformat(),
         "action": action,
         "course_code": course_code,
@@ -70,21 +265,16 @@ def record_change(
         "description": description or f"{field}: {old_value} → {new_value}",
     }
 
-    history.append(entry)
-    _save_history(history)
-
 
-def record_hours_change(
+def hours_entry(
     week_num: str,
     old_hours: float,
     new_hours: float,
     added_hours: float,
     course_code: Optional[str] = None,
-) -> None:
-    """Record a hours logging change."""
-    history = _load_history()
-
-    entry = {
+) -> Dict[str, Any]:
+    """Build a hours logging history entry without recording it."""
+    return {
         "timestamp": datetime.now().isoformat(),
         "action": "log_hours",
         "week_num": week_num,
@@ -95,8 +285,49 @@ def record_hours_change(
         "description": f"Logged {added_hours}h (total: {new_hours}h)",
     }
 
-    history.append(entry)
-    _save_history(history)
+
+def record_entry(entry: Dict[str, Any]) -> None:
+    """Record a prebuilt history entry for potential undo."""
+    _append_history(entry)
+
+
+def record_change(
+    action: str,
+    course_code: str,
+    assessment_key: str,
+    field: str,
+    old_value: Any,
+    new_value: Any,
+    description: Optional[str] = None,
+) -> None:
+    """
+    Record a change for potential undo.
+
+    Args:
+        action: Type of action (e.g., 'update_status', 'record_score', 'log_hours')
+        course_code: The course code
+        assessment_key: The assessment key
+        field: The field that was changed
+        old_value: Previous value
+        new_value: New value
+        description: Human-readable description of the change
+    """
+    _append_history(
+        change_entry(
+            action, course_code, assessment_key, field, old_value, new_value, description
+        )
+    )
+
+
+def record_hours_change(
+    week_num: str,
+    old_hours: float,
+    new_hours: float,
+    added_hours: float,
+    course_code: Optional[str] = None,
+) -> None:
+    """Record a hours logging change."""
+    _append_history(hours_entry(week_num, old_hours, new_hours, added_hours, course_code))
 
 
 def get_last_change() -> Optional[Dict[str, Any]]:
@@ -113,12 +344,23 @@ def get_recent_changes(count: int = 5) -> List[Dict[str, Any]]:
 
 def pop_last_change() -> Optional[Dict[str, Any]]:
     """Remove and return the most recent change."""
+    global _cache, _cache_key, _line_count
     history = _load_history()
     if not history:
         return None
 
+    if not _truncate_last_line(_cache_key[2]):
+        # Torn tail or concurrent writer: fall back to a full rewrite
+        entry = history.pop()
+        _save_history(history)
+        return entry
+
     entry = history.pop()
-    _save_history(history)
+    _line_count -= 1
+    if _line_count > len(history):
+        _cache = None  # Older lines now fall within the newest MAX_HISTORY
+    else:
+        _cache_key = _file_key()
     return entry
 
 
@@ -135,8 +377,8 @@ def format_change_description(entry: Dict[str, Any]) -> str:
     from .config import CODE_TO_ALIAS, COURSE_NAMES
 
     timestamp = datetime.fromisoformat(entry["timestamp"])
-    time_str = timestamp.strftime("%H:%M")
-    date_str = timestamp.strftime("%d %b")
+    time_str = f"{timestamp.hour:02d}:{timestamp.minute:02d}"
+    date_str = f"{timestamp.day:02d} {_MONTHS[timestamp.month - 1]}"
 
     action = entry.get("action", "unknown")
 
@@ -7,6 +7,9 @@ Uses osascript to display native macOS notifications with sound.
 import subprocess
 from typing import Optional
 
+# Escapes double quotes for embedding in an AppleScript string literal
+_APPLESCRIPT_ESCAPES = str.maketrans({'"': '\\"'})
+
 
 def send_notification(
     title: str,
@@ -17,6 +20,9 @@ def send_notification(
     """
     Send a macOS notification using osascript.
 
+    osascript is started in the background rather than waited for, so the
+    caller doesn't pay its startup time.
+
     Args:
         title: Notification title
         message: Main notification body
@@ -24,34 +30,29 @@ def send_notification(
         sound: Sound name (default: Glass). Set to "" for silent.
 
     Returns:
-        True if notification was sent successfully
+        True if osascript was started
     """
     # Escape quotes for AppleScript
-    title = title.replace('"', '\\"')
-    message = message.replace('"', '\\"')
+    title = title.translate(_APPLESCRIPT_ESCAPES)
+    message = message.translate(_APPLESCRIPT_ESCAPES)
 
-    script_parts = [f'display notification "{message}" with title "{title}"']
+    script = f'display notification "{message}" with title "{title}"'
 
     if subtitle:
-        subtitle = subtitle.replace('"', '\\"')
-        script_parts[0] = (
-            f'display notification "{message}" with title "{title}" subtitle "{subtitle}"'
-        )
+        script += f' subtitle "{subtitle.translate(_APPLESCRIPT_ESCAPES)}"'
 
     if sound:
-        script_parts[0] += f' sound name "{sound}"'
-
-    script = script_parts[0]
+        script += f' sound name "{sound}"'
 
     try:
-        result = subprocess.run(
+        subprocess.Popen(
             ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=10,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return True
+    except OSError:
         return False
 
 
@@ -7,20 +7,54 @@ Allows creating multi-block study plans like "1h do, 1h pc" that:
 - Sync plan to calendar
 """
 
-import json
 import os
 import re
+from bisect import bisect_right
+import shutil
 import subprocess
+import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .config import BASE_DIR, ALIAS_TO_CODE, CODE_TO_ALIAS, COURSE_NAMES
-from .errors import ValidationError, DataWriteError
+from .data import _json_dumps, _json_loads
+from .errors import CalendarError, ValidationError, DataWriteError
 from .notifications import send_study_notification
 
 PLAN_PATH = BASE_DIR / "plan.json"
 
+# Command that 'at' runs at each block transition, minus the block index.
+# sys.executable is the interpreter (and environment) running us now.
+_PYTHON_PATH = sys.executable or "python3"
+_NOTIFY_COMMAND = f'"{_PYTHON_PATH}" "{BASE_DIR / "scripts" / "plan_notify.py"}"'
+
+# Duration and plan-string patterns, compiled once
+_DURATION_COMBINED_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*h\s*(\d+)\s*m?$")
+_DURATION_HOURS_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*h$")
+_DURATION_MINS_RE = re.compile(r"^(\d+)\s*m(?:in)?$")
+_PLAN_SPLIT_RE = re.compile(r"(?=\d+(?:\.\d+)?[hm])")
+_PLAN_BLOCK_RE = re.compile(r"^(\d+(?:\.\d+)?[hm]?\d*m?)\s+(.+)$", re.IGNORECASE)
+
+
+def _build_substring_index() -> Dict[str, str]:
+    """Map every 2+ character substring of each course name to its code.
+
+    The first course (in COURSE_NAMES order) containing a substring wins,
+    matching the order of the linear scan in resolve_course.
+    """
+    index: Dict[str, str] = {}
+    for code, name in COURSE_NAMES.items():
+        lowered = name.lower()
+        for start in range(len(lowered) - 1):
+            for end in range(start + 2, len(lowered) + 1):
+                index.setdefault(lowered[start:end], code)
+    return index
+
+
+_NAME_SUBSTRING_INDEX = _build_substring_index()
+
 
 def parse_duration(duration_str: str) -> int:
     """
@@ -41,36 +75,51 @@ def parse_duration(duration_str: str) -> int:
     """
     duration_str = duration_str.strip().lower()
 
-    # Try combined format first (1h30m)
-    combined = re.match(r"^(\d+(?:\.\d+)?)\s*h\s*(\d+)\s*m?$", duration_str)
+    # Bare number (assumes minutes)
+    if duration_str.isdigit():
+        return int(duration_str)
+
+    # Fast paths for "1h"/"1.5h" and "30m"/"30min" using plain string checks;
+    # anything they don't fully accept falls through to the regexes
+    if duration_str.endswith("h"):
+        number = duration_str[:-1].rstrip()
+        whole, dot, frac = number.partition(".")
+        if whole.isdecimal() and (not dot or frac.isdecimal()):
+            return int(float(number) * 60)
+    elif duration_str.endswith("m") or duration_str.endswith("min"):
+        number = duration_str[: -3 if duration_str.endswith("min") else -1].rstrip()
+        if number.isdecimal():
+            return int(number)
+
+    # Combined format (1h30m)
+    combined = _DURATION_COMBINED_RE.match(duration_str)
     if combined:
         hours = float(combined.group(1))
         mins = int(combined.group(2))
         return int(hours * 60 + mins)
 
     # Hours only (1h, 1.5h)
-    hours_match = re.match(r"^(\d+(?:\.\d+)?)\s*h$", duration_str)
+    hours_match = _DURATION_HOURS_RE.match(duration_str)
     if hours_match:
         return int(float(hours_match.group(1)) * 60)
 
     # Minutes only (30m, 30min)
-    mins_match = re.match(r"^(\d+)\s*m(?:in)?$", duration_str)
+    mins_match = _DURATION_MINS_RE.match(duration_str)
     if mins_match:
         return int(mins_match.group(1))
 
-    # Bare number (assumes minutes)
-    if duration_str.isdigit():
-        return int(duration_str)
-
     raise ValidationError(
         f"Invalid duration format: {duration_str}. Use formats like: 1h, 30m, 1.5h, 1h30m, or 90",
     )
 
 
+@lru_cache(maxsize=128)
 def resolve_course(course_input: str) -> Tuple[str, str]:
     """
     Resolve a course alias or partial name to (code, name).
 
+    Results are memoized; failures raise every time and are not cached.
+
     Args:
         course_input: Alias (pc, do, cv, ao) or partial name
 
@@ -87,7 +136,10 @@ def resolve_course(course_input: str) -> Tuple[str, str]:
         code = ALIAS_TO_CODE[course_input]
         return code, COURSE_NAMES[code]
 
-    # Check partial name match
+    # Check partial name match, via the precomputed index first
+    code = _NAME_SUBSTRING_INDEX.get(course_input)
+    if code is not None:
+        return code, COURSE_NAMES[code]
     for code, name in COURSE_NAMES.items():
         if course_input in name.lower():
             return code, name
@@ -121,13 +173,13 @@ def parse_plan_string(plan_str: str) -> List[Dict]:
         parts = [p.strip() for p in plan_str.split(",")]
     else:
         # Try to split on duration patterns
-        parts = re.split(r"(?=\d+(?:\.\d+)?[hm])", plan_str)
+        parts = _PLAN_SPLIT_RE.split(plan_str)
         parts = [p.strip() for p in parts if p.strip()]
 
     blocks = []
     for part in parts:
         # Match "duration course"
-        match = re.match(r"^(\d+(?:\.\d+)?[hm]?\d*m?)\s+(.+)$", part, re.IGNORECASE)
+        match = _PLAN_BLOCK_RE.match(part)
         if not match:
             raise ValidationError(
                 f"Cannot parse block: {part}. Use format: <duration> <course>, e.g., '1h do' or '30m pc'",
@@ -153,31 +205,56 @@ def parse_plan_string(plan_str: str) -> List[Dict]:
     return blocks
 
 
+# plan.json's (mtime_ns, size) when last parsed, and the parsed plan
+_plan_cache: Tuple[Optional[Tuple[int, int]], Optional[Dict]] = (None, None)
+
+
 def load_plan() -> Optional[Dict]:
-    """Load the current plan from plan.json."""
-    if not PLAN_PATH.exists():
+    """Load the current plan from plan.json (cached until the file changes)."""
+    global _plan_cache
+    try:
+        st = PLAN_PATH.stat()
+    except OSError:
+        _plan_cache = (None, None)
         return None
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp == _plan_cache[0]:
+        return _plan_cache[1]
+
     try:
-        with open(PLAN_PATH) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+        plan = _json_loads(PLAN_PATH.read_bytes())
+    except (ValueError, OSError):
+        # Unreadable or not valid JSON
+        plan = None
+    _plan_cache = (stamp, plan)
+    return plan
 
 
 def save_plan(plan: Dict) -> None:
     """Save a plan to plan.json."""
+    global _plan_cache
+    _plan_cache = (None, None)
     try:
-        with open(PLAN_PATH, "w") as f:
-            json.dump(plan, f, indent=2, default=str)
+        with open(PLAN_PATH, "wb") as f:
+            f.write(_json_dumps(plan, pretty=False, default=str))
     except OSError as e:
         raise DataWriteError(str(PLAN_PATH), str(e))
 
 
 def clear_plan() -> None:
     """Remove the plan file."""
-    if PLAN_PATH.exists():
-        PLAN_PATH.unlink()
+    global _plan_cache
+    _plan_cache = (None, None)
+    PLAN_PATH.unlink(missing_ok=True)
+
+
+def _block_offsets(blocks: List[Dict]) -> List[int]:
+    """Minutes from plan start to each block's start, plus the plan's end."""
+    offsets = [0]
+    for block in blocks:
+        offsets.append(offsets[-1] + block["duration_mins"])
+    return offsets
 
 
 def get_plan_status() -> Optional[Dict]:
@@ -201,36 +278,30 @@ def get_plan_status() -> Optional[Dict]:
     now = datetime.now()
     start = datetime.fromisoformat(plan["start_time"])
 
-    # Find current block
+    blocks = plan["blocks"]
+    offsets = plan.get("block_offsets") or _block_offsets(blocks)
+    total = offsets[-1]
+
+    # Find current block: the last one starting at or before now
     elapsed = (now - start).total_seconds() / 60
-    cumulative = 0
-    current_idx = 0
-
-    for i, block in enumerate(plan["blocks"]):
-        cumulative += block["duration_mins"]
-        if elapsed < cumulative:
-            current_idx = i
-            break
-    else:
+    current_idx = max(0, bisect_right(offsets, elapsed) - 1)
+
+    if current_idx >= len(blocks):
         # Plan is complete
         return {
             "completed": True,
-            "blocks": plan["blocks"],
-            "total_mins": sum(b["duration_mins"] for b in plan["blocks"]),
+            "blocks": blocks,
+            "total_mins": total,
         }
 
-    current_block = plan["blocks"][current_idx]
-    block_start = sum(b["duration_mins"] for b in plan["blocks"][:current_idx])
-    time_in_block = elapsed - block_start
-    time_remaining = current_block["duration_mins"] - time_in_block
+    current_block = blocks[current_idx]
+    time_remaining = offsets[current_idx + 1] - elapsed
 
     next_course = None
-    if current_idx + 1 < len(plan["blocks"]):
-        next_course = plan["blocks"][current_idx + 1]["course_name"]
+    if current_idx + 1 < len(blocks):
+        next_course = blocks[current_idx + 1]["course_name"]
 
-    total_remaining = (
-        sum(b["duration_mins"] for b in plan["blocks"][current_idx:]) - time_in_block
-    )
+    total_remaining = total - elapsed
 
     return {
         "completed": False,
@@ -240,11 +311,17 @@ def get_plan_status() -> Optional[Dict]:
         "time_remaining_mins": max(0, time_remaining),
         "next_course": next_course,
         "total_remaining_mins": max(0, total_remaining),
-        "blocks": plan["blocks"],
+        "blocks": blocks,
         "start_time": start,
     }
 
 
+@lru_cache(maxsize=1)
+def _find_at() -> Optional[str]:
+    """Locate the 'at' binary once per process."""
+    return shutil.which("at")
+
+
 def schedule_notification(when: datetime, block_idx: int) -> bool:
     """
     Schedule a notification using the 'at' command.
@@ -256,16 +333,12 @@ def schedule_notification(when: datetime, block_idx: int) -> bool:
     Returns:
         True if scheduled successfully
     """
-    # Create the command that 'at' will run
-    script_path = BASE_DIR / "scripts" / "plan_notify.py"
-    python_path = subprocess.run(
-        ["which", "python3"], capture_output=True, text=True
-    ).stdout.strip()
-
-    if not python_path:
-        python_path = "python3"
+    at_path = _find_at()
+    if not at_path:
+        return False
 
-    cmd = f'{python_path} "{script_path}" {block_idx}'
+    # Create the command that 'at' will run
+    cmd = f"{_NOTIFY_COMMAND} {block_idx}"
 
     # Format time for 'at' command
     at_time = when.strftime("%H:%M %Y-%m-%d")
@@ -273,7 +346,7 @@ def schedule_notification(when: datetime, block_idx: int) -> bool:
     try:
         # Use 'at' to schedule the command
         result = subprocess.run(
-            ["at", "-t", when.strftime("%Y%m%d%H%M")],
+            [at_path, "-t", when.strftime("%Y%m%d%H%M")],
             input=cmd,
             capture_output=True,
             text=True,
@@ -284,6 +357,23 @@ def schedule_notification(when: datetime, block_idx: int) -> bool:
         return False
 
 
+# calendar_sync.add_plan_to_calendar once imported, or False if unavailable
+_add_plan_to_calendar = None
+
+
+def _get_calendar_sync():
+    """Import calendar_sync on first use and remember the outcome."""
+    global _add_plan_to_calendar
+    if _add_plan_to_calendar is None:
+        try:
+            from .calendar_sync import add_plan_to_calendar
+        except ImportError:
+            _add_plan_to_calendar = False
+        else:
+            _add_plan_to_calendar = add_plan_to_calendar
+    return _add_plan_to_calendar or None
+
+
 def create_plan(plan_str: str) -> Dict:
     """
     Create and start a new study plan.
@@ -298,20 +388,21 @@ def create_plan(plan_str: str) -> Dict:
         ValidationError: If plan cannot be parsed
     """
     blocks = parse_plan_string(plan_str)
+    offsets = _block_offsets(blocks)
     now = datetime.now()
 
     plan = {
         "start_time": now.isoformat(),
         "blocks": blocks,
+        "block_offsets": offsets,
+        "total_mins": offsets[-1],
         "created_at": now.isoformat(),
     }
 
     # Schedule notifications for each block transition
-    cumulative_mins = 0
     scheduled = []
-    for i, block in enumerate(blocks):
-        cumulative_mins += block["duration_mins"]
-        notify_time = now + timedelta(minutes=cumulative_mins)
+    for i, end_mins in enumerate(offsets[1:]):
+        notify_time = now + timedelta(minutes=end_mins)
 
         if schedule_notification(notify_time, i):
             scheduled.append(i)
@@ -319,14 +410,14 @@ def create_plan(plan_str: str) -> Dict:
     plan["notifications_scheduled"] = scheduled
 
     # Add to calendar
-    try:
-        from .calendar_sync import add_plan_to_calendar
-
-        calendar_events = add_plan_to_calendar(blocks, now)
-        plan["calendar_events"] = calendar_events
-    except Exception:
-        # Calendar sync is best-effort, don't fail the plan creation
-        plan["calendar_events"] = 0
+    plan["calendar_events"] = 0
+    add_plan_to_calendar = _get_calendar_sync()
+    if add_plan_to_calendar is not None:
+        try:
+            plan["calendar_events"] = add_plan_to_calendar(blocks, now)
+        except (CalendarError, OSError):
+            # Calendar sync is best-effort, don't fail the plan creation
+            pass
 
     # Send start notification
     first_block = blocks[0]
@@ -424,10 +515,10 @@ def stop_plan(log_partial: bool = True) -> Optional[Dict]:
     try:
         # List at jobs and cancel them
         result = subprocess.run(["atq"], capture_output=True, text=True, timeout=5)
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                job_id = line.split()[0]
-                subprocess.run(["atrm", job_id], capture_output=True, timeout=5)
+        job_ids = [line.split()[0] for line in result.stdout.splitlines() if line.strip()]
+        if job_ids:
+            # atrm takes any number of job IDs
+            subprocess.run(["atrm", *job_ids], capture_output=True, timeout=5)
     except (subprocess.TimeoutExpired, OSError):
         pass
 
@@ -4,12 +4,13 @@ Taskwarrior adapter module.
 Provides functions to interact with Taskwarrior for task management.
 """
 
-import json
 import subprocess
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from .config import ALIAS_TO_CODE, CODE_TO_ALIAS, COURSE_NAMES
+from .data import _json_loads
 
 
 def run_task_command(args: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
@@ -27,17 +28,67 @@ def run_task_command(args: List[str], capture_output: bool = True) -> subprocess
     return subprocess.run(cmd, capture_output=capture_output, text=True)
 
 
+def _export_tasks(filters: List[str]) -> Optional[List[Dict]]:
+    """
+    Run `task <filters> export` and parse its JSON output.
+
+    stdout is captured as bytes and handed straight to the JSON parser, so
+    large exports are not decoded to str first.
+
+    Args:
+        filters: Filter arguments placed before 'export'
+
+    Returns:
+        List of task dictionaries, or None if the command failed
+    """
+    result = subprocess.run(["task"] + filters + ["export"], capture_output=True)
+    if result.returncode != 0:
+        return None
+    return _json_loads(result.stdout) if result.stdout.strip() else []
+
+
+# Successful exports by filter tuple; failures are not cached so the next
+# call retries. Cleared by invalidate_task_cache() after tasks change.
+_export_cache: Dict[Tuple[str, ...], List[Dict]] = {}
+
+
+def _cached_export(filters: Tuple[str, ...]) -> List[Dict]:
+    """
+    Export tasks matching filters, running `task` once per filter per process.
+
+    Filtering stays on the Taskwarrior side, so each view only transfers and
+    parses the tasks it needs. Callers get a new list they may reorder or
+    extend, but the task dicts in it are the cached ones: treat them as
+    read-only, or copy a task before changing it.
+
+    Args:
+        filters: Filter arguments placed before 'export'
+
+    Returns:
+        List of task dictionaries (empty if the command failed)
+    """
+    tasks = _export_cache.get(filters)
+    if tasks is None:
+        tasks = _export_tasks(list(filters))
+        if tasks is None:
+            return []
+        _export_cache[filters] = tasks
+    return list(tasks)
+
+
+def invalidate_task_cache() -> None:
+    """Forget cached exports so the next getter re-reads Taskwarrior."""
+    _export_cache.clear()
+
+
 def get_all_tasks() -> List[Dict]:
     """
     Get all tasks from Taskwarrior.
 
     Returns:
-        List of task dictionaries
+        List of task dictionaries (cached; treat as read-only)
     """
-    result = run_task_command(["export"])
-    if result.returncode != 0:
-        return []
-    return json.loads(result.stdout) if result.stdout.strip() else []
+    return _cached_export(())
 
 
 def get_pending_tasks() -> List[Dict]:
@@ -45,12 +96,9 @@ def get_pending_tasks() -> List[Dict]:
     Get all pending (not completed) tasks.
 
     Returns:
-        List of pending task dictionaries
+        List of pending task dictionaries (cached; treat as read-only)
     """
-    result = run_task_command(["status:pending", "export"])
-    if result.returncode != 0:
-        return []
-    return json.loads(result.stdout) if result.stdout.strip() else []
+    return _cached_export(("status:pending",))
 
 
 def get_tasks_by_course(course_alias: str) -> List[Dict]:
@@ -61,12 +109,9 @@ def get_tasks_by_course(course_alias: str) -> List[Dict]:
         course_alias: Course alias (pc, do, cv, ao)
 
     Returns:
-        List of task dictionaries for that course
+        List of task dictionaries for that course (cached; treat as read-only)
     """
-    result = run_task_command([f"project.startswith:{course_alias}", "export"])
-    if result.returncode != 0:
-        return []
-    return json.loads(result.stdout) if result.stdout.strip() else []
+    return _cached_export((f"project.startswith:{course_alias}",))
 
 
 def get_tasks_with_due_dates() -> List[Dict]:
@@ -74,14 +119,12 @@ def get_tasks_with_due_dates() -> List[Dict]:
     Get all pending tasks that have due dates.
 
     Returns:
-        List of task dictionaries with due dates
+        List of task dictionaries with due dates (cached; treat as read-only)
     """
-    result = run_task_command(["status:pending", "due.any:", "export"])
-    if result.returncode != 0:
-        return []
-    return json.loads(result.stdout) if result.stdout.strip() else []
+    return _cached_export(("status:pending", "due.any:"))
 
 
+@lru_cache(maxsize=1024)
 def parse_taskwarrior_date(date_str: str) -> Optional[datetime]:
     """
     Parse a Taskwarrior ISO 8601 date string.
@@ -97,10 +140,19 @@ def parse_taskwarrior_date(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
 
+    # Remove 'Z' suffix and slice the fixed-width fields directly
+    clean = date_str.rstrip("Z")
     try:
-        # Remove 'Z' suffix and parse
-        clean = date_str.rstrip("Z")
-        return datetime.strptime(clean, "%Y%m%dT%H%M%S")
+        if len(clean) != 15 or clean[8] != "T":
+            raise ValueError(date_str)
+        return datetime(
+            int(clean[0:4]),
+            int(clean[4:6]),
+            int(clean[6:8]),
+            int(clean[9:11]),
+            int(clean[11:13]),
+            int(clean[13:15]),
+        )
     except ValueError:
         try:
             # Try alternate format
@@ -119,7 +171,7 @@ def format_date_for_taskwarrior(dt: datetime) -> str:
     Returns:
         Taskwarrior-compatible date string (YYYY-MM-DD)
     """
-    return dt.strftime("%Y-%m-%d")
+    return dt.date().isoformat()
 
 
 def add_task(
@@ -161,6 +213,7 @@ def add_task(
             cmd.append(f"+{tag}")
 
     result = run_task_command(cmd)
+    invalidate_task_cache()
     if result.returncode == 0:
         # Parse task ID from output like "Created task 1."
         output = result.stdout.strip()
@@ -195,6 +248,7 @@ def modify_task(task_id: int, **changes) -> bool:
             cmd.append(f"{key}:{value}")
 
     result = run_task_command(cmd)
+    invalidate_task_cache()
     return result.returncode == 0
 
 
@@ -209,6 +263,7 @@ def complete_task(task_id: int) -> bool:
         True if successful
     """
     result = run_task_command([str(task_id), "done"])
+    invalidate_task_cache()
     return result.returncode == 0
 
 
@@ -219,11 +274,7 @@ def complete_overdue_tasks() -> List[Dict]:
     Returns:
         List of task dicts that were completed
     """
-    result = run_task_command(["status:pending", "due.before:now", "export"])
-    if result.returncode != 0 or not result.stdout.strip():
-        return []
-
-    tasks = json.loads(result.stdout)
+    tasks = _export_tasks(["status:pending", "due.before:now"])
     if not tasks:
         return []
 
@@ -231,6 +282,7 @@ def complete_overdue_tasks() -> List[Dict]:
     ids = [str(t["id"]) for t in tasks if t.get("id")]
     if ids:
         run_task_command(["rc.confirmation:no", "rc.bulk:100"] + ids + ["done"])
+        invalidate_task_cache()
 
     return tasks
 
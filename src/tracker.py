@@ -8,11 +8,22 @@ Provides all the main tracker commands with:
 - Consistent date formatting
 """
 
+import heapq
+import sys
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, List, Dict, Iterator, Tuple
 
 from .config import COURSE_NAMES, CODE_TO_ALIAS, ALIAS_TO_CODE, VALID_STATUSES
-from .data import load_tracker, save_tracker, get_course_display_name
+from .data import (
+    NO_DEADLINE,
+    load_tracker,
+    save_tracker,
+    get_course_display_name,
+    parse_deadline,
+)
 from .errors import ValidationError, DataError
 from .validation import (
     resolve_course_code,
@@ -29,73 +40,145 @@ from .ui import (
     cyan,
     gray,
     dim,
+    bold_red,
+    bold_yellow,
     format_status_emoji,
     format_days_remaining,
     format_date,
     format_progress_summary,
     format_progress_bar,
+    format_header,
+    format_subheader,
     print_header,
-    print_subheader,
     print_success,
     print_warning,
     print_error,
 )
 from . import history
 
+# Statuses that count as done, and that are left out of totals
+_DONE = frozenset({"completed", "submitted"})
+_SKIP_TOTAL = frozenset({"ongoing"})
 
-def _get_all_assessments(data: dict) -> List[Tuple[str, str, dict]]:
-    """Get all assessments as (course_code, key, assessment) tuples."""
-    assessments = []
-    for code, course in data["courses"].items():
-        for key, assessment in course["assessments"].items():
-            assessments.append((code, key, assessment))
-    return assessments
+# History actions undo_last_change knows how to revert
+_UNDOABLE_ACTIONS = frozenset({"update_status", "record_score", "log_hours"})
 
 
-def _get_progress_stats(data: dict) -> Tuple[int, int]:
-    """Get (completed, total) counts for all assessments."""
-    total = 0
-    completed = 0
+def _write_lines(lines: List[str]) -> None:
+    """Write rendered lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    for code, course in data["courses"].items():
-        for key, assessment in course["assessments"].items():
-            status = assessment.get("status", "not_started")
-            # Don't count ongoing items in total
-            if status != "ongoing":
-                total += 1
-                if status in ("completed", "submitted"):
-                    completed += 1
 
-    return completed, total
+def _get_all_assessments(data: dict) -> List[Tuple[str, str, dict]]:
+    """Get all assessments as a flat list of (course_code, key, assessment) tuples."""
+    return [
+        (code, key, assessment)
+        for code, course in data["courses"].items()
+        for key, assessment in course["assessments"].items()
+    ]
+
+
+def _iter_parsed_deadlines(
+    data: dict,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterator[Tuple[datetime, str, str, dict]]:
+    """
+    Yield outstanding assessments that have a parseable deadline.
+
+    Completed and submitted assessments are skipped.
 
+    Args:
+        data: Tracker data
+        since: If given, skip deadlines before this
+        until: If given, skip deadlines after this
 
-def _get_next_deadline(data: dict) -> Optional[Tuple[datetime, str]]:
-    """Get the next upcoming deadline as (date, name) or None."""
-    today = datetime.now()
-    next_dl = None
+    Yields:
+        Tuples of (deadline, course_code, key, assessment) in tracker order
+    """
+    for code, key, assessment in _get_all_assessments(data):
+        if assessment.get("status", "") in _DONE:
+            continue
+        dl_date = parse_deadline(assessment.get("deadline", ""))
+        if dl_date is None:
+            continue
+        if since is not None and dl_date < since:
+            continue
+        if until is not None and dl_date > until:
+            continue
+        yield dl_date, code, key, assessment
+
+
+def _build_soa(
+    data: dict,
+) -> Tuple[List[str], List[str], List[str], List[str], List[Optional[datetime]]]:
+    """
+    Flatten all assessments into parallel lists, parsing deadlines once.
+
+    Returns:
+        Tuple of (course_codes, keys, names, statuses, deadline_dates), where
+        index i of every list describes the same assessment
+    """
+    course_codes = []
+    keys = []
+    names = []
+    statuses = []
+    deadline_dates = []
 
     for code, course in data["courses"].items():
         for key, assessment in course["assessments"].items():
-            status = assessment.get("status", "")
-            deadline = assessment.get("deadline", "")
+            course_codes.append(code)
+            keys.append(key)
+            names.append(assessment.get("name", key))
+            statuses.append(assessment.get("status", "not_started"))
+            deadline_dates.append(parse_deadline(assessment.get("deadline", "")))
+
+    return course_codes, keys, names, statuses, deadline_dates
 
-            if status in ("completed", "submitted"):
-                continue
-            if not deadline or deadline in ("TBD", "ongoing"):
-                continue
 
-            try:
-                if " to " in deadline:
-                    deadline = deadline.split(" to ")[0]
-                dl_date = datetime.strptime(deadline, "%Y-%m-%d")
+def _summarize(
+    data: dict, today: datetime
+) -> Tuple[int, int, Optional[Tuple[datetime, str]], Dict[str, Tuple[int, int]]]:
+    """
+    Gather progress and deadline figures from the flattened assessments.
 
-                if dl_date >= today:
-                    if next_dl is None or dl_date < next_dl[0]:
-                        next_dl = (dl_date, assessment["name"])
-            except ValueError:
-                continue
+    Ongoing items are not counted towards totals.
 
-    return next_dl
+    Args:
+        data: Tracker data
+        today: Deadlines before this are not considered upcoming
+
+    Returns:
+        Tuple of (completed, total, next deadline as (date, name) or None,
+        dict of course_code -> (completed, total))
+    """
+    course_codes, _, names, statuses, deadline_dates = _build_soa(data)
+
+    counts = {code: [0, 0] for code in data["courses"]}
+    for code, status in zip(course_codes, statuses):
+        if status not in _SKIP_TOTAL:
+            course_counts = counts[code]
+            course_counts[1] += 1
+            if status in _DONE:
+                course_counts[0] += 1
+    per_course = {code: (done, total) for code, (done, total) in counts.items()}
+
+    completed = sum(done for done, _ in per_course.values())
+    total = sum(total for _, total in per_course.values())
+
+    next_dl = min(
+        (
+            (dl_date, name)
+            for dl_date, name, status in zip(deadline_dates, names, statuses)
+            if dl_date is not None
+            and dl_date >= today
+            and status not in _DONE
+        ),
+        key=itemgetter(0),
+        default=None,
+    )
+
+    return completed, total, next_dl, per_course
 
 
 def _build_assessment_index(data: dict) -> Dict[str, List[Tuple[str, str]]]:
@@ -129,9 +212,9 @@ def resolve_assessment_shortcut(
     # Try as a number first
     if shortcut.isdigit():
         idx = int(shortcut) - 1  # 1-indexed for users
-        keys = list(assessments.keys())
-        if 0 <= idx < len(keys):
-            return keys[idx]
+        if 0 <= idx < len(assessments):
+            return next(islice(assessments, idx, None))
+        keys = list(assessments)
         raise ValidationError(
             f"Assessment #{shortcut} out of range (1-{len(keys)})",
             field="assessment",
@@ -144,42 +227,44 @@ def resolve_assessment_shortcut(
 
 def show_status() -> None:
     """Display all assessment statuses with progress summary."""
-    data = load_tracker()
+    data = load_tracker(shared=True)
+    lines: List[str] = []
+    emit = lines.append
+    now = datetime.now()
+    # Deadlines before these are at most 3 and 7 whole days away
+    within_3_days = now + timedelta(days=4)
+    within_7_days = now + timedelta(days=8)
 
-    # Calculate overall progress
-    completed, total = _get_progress_stats(data)
-    next_dl = _get_next_deadline(data)
+    # Calculate overall and per-course progress
+    completed, total, next_dl, per_course = _summarize(data, now)
 
     # Header with progress
-    print_header("STUDY TRACKER")
+    emit(format_header("STUDY TRACKER"))
 
     # Overall summary line
     progress = format_progress_summary(completed, total)
     if next_dl:
-        days = (next_dl[0] - datetime.now()).days
+        days = (next_dl[0] - now).days
         next_str = f"Next: {format_days_remaining(days, short=True)}"
-        print(f"\n{progress}  |  {next_str}")
+        emit(f"\n{progress}  |  {next_str}")
     else:
-        print(f"\n{progress}")
+        emit(f"\n{progress}")
+
+    emit(dim(f"Last updated: {data.get('last_updated', 'Unknown')}"))
 
-    print(dim(f"Last updated: {data.get('last_updated', 'Unknown')}"))
+    # Colour codes for the per-assessment lines, read once per render
+    _DIM, _RED, _YELLOW = Colors.DIM, Colors.RED, Colors.YELLOW
+    _CYAN, _GREEN, _RESET = Colors.CYAN, Colors.GREEN, Colors.RESET
+    get_alias, get_name = CODE_TO_ALIAS.get, COURSE_NAMES.get
 
     # Each course
     for code, course in data["courses"].items():
-        alias = CODE_TO_ALIAS.get(code, "??")
-        name = COURSE_NAMES.get(code, code)
-
-        # Course progress
-        course_completed = sum(
-            1
-            for a in course["assessments"].values()
-            if a.get("status") in ("completed", "submitted")
-        )
-        course_total = sum(
-            1 for a in course["assessments"].values() if a.get("status") != "ongoing"
-        )
+        alias = get_alias(code, "??")
+        name = get_name(code, code)
+
+        course_completed, course_total = per_course[code]
 
-        print_subheader(f"[{alias}] {name}")
+        emit(format_subheader(f"[{alias}] {name}"))
 
         # Numbered list of assessments
         for i, (key, assessment) in enumerate(course["assessments"].items(), 1):
@@ -191,67 +276,67 @@ def show_status() -> None:
             emoji = format_status_emoji(status)
 
             # Format deadline with urgency
-            if deadline not in ("TBD", "ongoing", ""):
-                try:
-                    dl_str = (
-                        deadline.split(" to ")[0] if " to " in deadline else deadline
-                    )
-                    dl_date = datetime.strptime(dl_str, "%Y-%m-%d")
-                    days = (dl_date - datetime.now()).days
-
-                    if status not in ("completed", "submitted"):
-                        date_display = format_date(dl_date, "short")
-                        if days < 0:
-                            deadline_str = red(f"{date_display} (OVERDUE)")
-                        elif days <= 3:
-                            deadline_str = yellow(f"{date_display} ({days}d)")
-                        elif days <= 7:
-                            deadline_str = cyan(f"{date_display} ({days}d)")
-                        else:
-                            deadline_str = f"{date_display}"
-                    else:
-                        deadline_str = dim(format_date(dl_date, "short"))
-                except ValueError:
+            if deadline not in NO_DEADLINE:
+                dl_date = parse_deadline(deadline)
+                if dl_date is None:
                     deadline_str = deadline
+                elif status not in _DONE:
+                    date_display = format_date(dl_date, "short")
+                    if dl_date < now:
+                        deadline_str = f"{_RED}{date_display} (OVERDUE){_RESET}"
+                    elif dl_date < within_3_days:
+                        days = (dl_date - now).days
+                        deadline_str = f"{_YELLOW}{date_display} ({days}d){_RESET}"
+                    elif dl_date < within_7_days:
+                        days = (dl_date - now).days
+                        deadline_str = f"{_CYAN}{date_display} ({days}d){_RESET}"
+                    else:
+                        deadline_str = f"{date_display}"
+                else:
+                    deadline_str = f"{_DIM}{format_date(dl_date, 'short')}{_RESET}"
             else:
-                deadline_str = dim(deadline)
+                deadline_str = f"{_DIM}{deadline}{_RESET}"
 
             # Build the line
-            num_str = dim(f"{i}.")
-            score_str = f" {green('[' + score + ']')}" if score else ""
-            weight_str = dim(f" ({weight})") if weight else ""
+            num_str = f"{_DIM}{i}.{_RESET}"
+            score_str = f" {_GREEN}[{score}]{_RESET}" if score else ""
+            weight_str = f"{_DIM} ({weight}){_RESET}" if weight else ""
             name_str = assessment["name"]
 
             # Dim completed items
-            if status in ("completed", "submitted"):
-                name_str = dim(name_str)
+            if status in _DONE:
+                name_str = f"{_DIM}{name_str}{_RESET}"
 
-            print(
+            emit(
                 f"  {num_str} {emoji} {name_str}{weight_str}: {deadline_str}{score_str}"
             )
 
         # Course progress bar
         if course_total > 0:
-            print(
+            emit(
                 f"      {format_progress_bar(course_completed, course_total, width=15)}"
             )
 
+    _write_lines(lines)
+
 
 def show_courses() -> None:
     """Show course codes and assessment keys (simplified)."""
-    data = load_tracker()
+    data = load_tracker(shared=True)
 
-    print_header("QUICK REFERENCE")
+    lines = [format_header("QUICK REFERENCE")]
+    emit = lines.append
 
     # Course codes
-    print(f"\n{bold('Course Codes:')}")
+    emit(f"\n{bold('Course Codes:')}")
     for alias, code in sorted(ALIAS_TO_CODE.items(), key=lambda x: x[1]):
-        print(f"  {bold(alias):6} {COURSE_NAMES[code]}")
+        emit(f"  {bold(alias):6} {COURSE_NAMES[code]}")
 
     # Assessments by course with numbers
+    get_alias = CODE_TO_ALIAS.get
     for code, course in data["courses"].items():
-        alias = CODE_TO_ALIAS.get(code, "??")
-        print_subheader(f"[{alias}] Assessments")
+        alias = get_alias(code, "??")
+        emit(format_subheader(f"[{alias}] Assessments"))
 
         for i, (key, assessment) in enumerate(course["assessments"].items(), 1):
             status = assessment.get("status", "not_started")
@@ -261,9 +346,10 @@ def show_courses() -> None:
             num = dim(f"{i}.")
             key_display = cyan(key)
 
-            print(f"  {num} {emoji} {key_display:22} {assessment['name']}")
+            emit(f"  {num} {emoji} {key_display:22} {assessment['name']}")
 
-    print(f"\n{dim('Tip: Use numbers as shortcuts, e.g., study u pc 2 done')}")
+    emit(f"\n{dim('Tip: Use numbers as shortcuts, e.g., study u pc 2 done')}")
+    _write_lines(lines)
 
 
 def show_next_deadlines(count: Optional[int] = None, weeks: int = 2) -> None:
@@ -274,55 +360,12 @@ def show_next_deadlines(count: Optional[int] = None, weeks: int = 2) -> None:
         count: Max number to show (None = show all within timeframe)
         weeks: Show deadlines within this many weeks (default 2)
     """
-    data = load_tracker()
-    deadlines = []
+    data = load_tracker(shared=True)
+    lines: List[str] = []
+    emit = lines.append
     today = datetime.now()
     cutoff = today + timedelta(weeks=weeks) if count is None else None
 
-    for code, course in data["courses"].items():
-        for key, assessment in course["assessments"].items():
-            deadline = assessment.get("deadline", "")
-            status = assessment.get("status", "")
-
-            if status in ("completed", "submitted"):
-                continue
-            if not deadline or deadline in ("TBD", "ongoing"):
-                continue
-
-            try:
-                if " to " in deadline:
-                    deadline = deadline.split(" to ")[0]
-                deadline_date = datetime.strptime(deadline, "%Y-%m-%d")
-
-                # Filter by cutoff if no count specified
-                if cutoff and deadline_date > cutoff:
-                    continue
-
-                deadlines.append(
-                    {
-                        "date": deadline_date,
-                        "code": code,
-                        "key": key,
-                        "name": assessment["name"],
-                        "status": status,
-                        "weight": assessment.get("weight", ""),
-                    }
-                )
-            except ValueError:
-                pass
-
-    deadlines.sort(key=lambda x: x["date"])
-
-    # Apply count limit
-    if count:
-        deadlines = deadlines[:count]
-
-    print_header("UPCOMING DEADLINES")
-
-    if not deadlines:
-        print(f"\n{green('No upcoming deadlines!')} 🎉")
-        return
-
     # Group by urgency
     overdue = []
     this_week = []
@@ -333,47 +376,89 @@ def show_next_deadlines(count: Optional[int] = None, weeks: int = 2) -> None:
     next_week_start = week_start + timedelta(weeks=1)
     week_after_start = week_start + timedelta(weeks=2)
 
-    for dl in deadlines:
-        days = (dl["date"] - today).days
-        if days < 0:
-            overdue.append(dl)
-        elif dl["date"] < next_week_start:
-            this_week.append(dl)
-        elif dl["date"] < week_after_start:
-            next_week.append(dl)
+    # Bucket i holds deadlines in [bounds[i - 1], bounds[i])
+    bounds = (today, next_week_start, week_after_start)
+    buckets = (overdue, this_week, next_week, later)
+
+    def add_to_bucket(dl):
+        buckets[bisect_right(bounds, dl["date"])].append(dl)
+
+    # With a count, keep only the earliest `count` in a heap whose root is
+    # the latest kept deadline: entries are (-day ordinal, -position, dl), so
+    # ties go to the assessment listed first
+    heap = []
+
+    # Filter by cutoff if no count specified
+    upcoming = _iter_parsed_deadlines(data, until=cutoff)
+    for position, (deadline_date, code, key, assessment) in enumerate(upcoming):
+        if count:
+            rank = (-deadline_date.toordinal(), -position)
+            if len(heap) == count and rank < heap[0][:2]:
+                continue  # Later than everything already kept
+
+        dl = {
+            "date": deadline_date,
+            "code": code,
+            "key": key,
+            "name": assessment["name"],
+            "status": assessment.get("status", ""),
+            "weight": assessment.get("weight", ""),
+        }
+        if not count:
+            add_to_bucket(dl)
+        elif len(heap) < count:
+            heapq.heappush(heap, (*rank, dl))
         else:
-            later.append(dl)
+            heapq.heapreplace(heap, (*rank, dl))
+
+    if count:
+        for *_, dl in sorted(heap, reverse=True):
+            add_to_bucket(dl)
+    else:
+        for bucket in (overdue, this_week, next_week, later):
+            bucket.sort(key=itemgetter("date"))
+
+    emit(format_header("UPCOMING DEADLINES"))
+
+    if not (overdue or this_week or next_week or later):
+        emit(f"\n{green('No upcoming deadlines!')} 🎉")
+        _write_lines(lines)
+        return
 
-    def print_deadline(dl):
+    get_alias = CODE_TO_ALIAS.get
+
+    def emit_deadline(dl):
         days = (dl["date"] - today).days
-        alias = CODE_TO_ALIAS.get(dl["code"], "??")
+        alias = get_alias(dl["code"], "??")
 
         date_str = format_date(dl["date"], "short")
         days_str = format_days_remaining(days, short=True)
         weight_str = dim(f" ({dl['weight']})") if dl["weight"] else ""
 
-        print(f"  {date_str:8} {bold(dl['name'])}{weight_str}")
-        print(f"           [{alias}] {days_str}")
+        emit(f"  {date_str:8} {bold(dl['name'])}{weight_str}")
+        emit(f"           [{alias}] {days_str}")
 
     if overdue:
-        print(f"\n{bold_red('⚠ OVERDUE:')}")
+        emit(f"\n{bold_red('⚠ OVERDUE:')}")
         for dl in overdue:
-            print_deadline(dl)
+            emit_deadline(dl)
 
     if this_week:
-        print(f"\n{bold_yellow('This Week:')}")
+        emit(f"\n{bold_yellow('This Week:')}")
         for dl in this_week:
-            print_deadline(dl)
+            emit_deadline(dl)
 
     if next_week:
-        print(f"\n{bold('Next Week:')}")
+        emit(f"\n{bold('Next Week:')}")
         for dl in next_week:
-            print_deadline(dl)
+            emit_deadline(dl)
 
     if later:
-        print(f"\n{dim('Later:')}")
+        emit(f"\n{dim('Later:')}")
         for dl in later:
-            print_deadline(dl)
+            emit_deadline(dl)
+
+    _write_lines(lines)
 
 
 def update_status(course_input: str, assessment_input: str, new_status: str) -> None:
@@ -402,8 +487,8 @@ def update_status(course_input: str, assessment_input: str, new_status: str) ->
 
     course["assessments"][assessment_key]["status"] = new_status
 
-    # Record in history for undo
-    history.record_change(
+    # Saved together with the history entry for undo
+    entry = history.change_entry(
         action="update_status",
         course_code=course_code,
         assessment_key=assessment_key,
@@ -413,7 +498,7 @@ def update_status(course_input: str, assessment_input: str, new_status: str) ->
         description=f"[{CODE_TO_ALIAS.get(course_code, '??')}] {assessment_key}: {old_status} → {new_status}",
     )
 
-    save_tracker(data)
+    save_tracker(data, history_entry=entry)
 
     alias = CODE_TO_ALIAS.get(course_code, "??")
     assessment_name = course["assessments"][assessment_key]["name"]
@@ -445,8 +530,8 @@ def record_score(course_input: str, assessment_input: str, score: str) -> None:
     course["assessments"][assessment_key]["score"] = score
     course["assessments"][assessment_key]["status"] = "completed"
 
-    # Record in history
-    history.record_change(
+    # Saved together with the history entry for undo
+    entry = history.change_entry(
         action="record_score",
         course_code=course_code,
         assessment_key=assessment_key,
@@ -455,7 +540,7 @@ def record_score(course_input: str, assessment_input: str, score: str) -> None:
         new_value=score,
     )
 
-    save_tracker(data)
+    save_tracker(data, history_entry=entry)
 
     alias = CODE_TO_ALIAS.get(course_code, "??")
     assessment_name = course["assessments"][assessment_key]["name"]
@@ -509,8 +594,8 @@ def log_hours(hours_input: str, course_input: Optional[str] = None) -> None:
         course_hours = week_log["hours_by_course"].get(course_code, 0)
         week_log["hours_by_course"][course_code] = course_hours + hours
 
-    # Record in history
-    history.record_hours_change(
+    # Saved together with the history entry for undo
+    entry = history.hours_entry(
         week_num=week_num,
         old_hours=old_total,
         new_hours=new_total,
@@ -518,7 +603,7 @@ def log_hours(hours_input: str, course_input: Optional[str] = None) -> None:
         course_code=course_code,
     )
 
-    save_tracker(data)
+    save_tracker(data, history_entry=entry)
 
     # Output
     if course_code:
@@ -532,90 +617,82 @@ def log_hours(hours_input: str, course_input: Optional[str] = None) -> None:
     # Show breakdown if there's course-specific hours
     if week_log.get("hours_by_course"):
         print(f"\n  {dim('Breakdown:')}")
+        get_alias = CODE_TO_ALIAS.get
         for c, h in week_log["hours_by_course"].items():
-            alias = CODE_TO_ALIAS.get(c, "??")
+            alias = get_alias(c, "??")
             print(f"    [{alias}] {h}h")
 
 
 def show_weekly_summary() -> None:
     """Show summary for current week."""
-    data = load_tracker()
+    data = load_tracker(shared=True)
+    lines: List[str] = []
+    emit = lines.append
+    get_alias, get_name = CODE_TO_ALIAS.get, COURSE_NAMES.get
     today = datetime.now()
     week_num = today.strftime("%Y-W%W")
 
-    print_header("WEEKLY SUMMARY")
+    emit(format_header("WEEKLY SUMMARY"))
 
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
-    print(f"\n{format_date(week_start, 'short')} - {format_date(week_end, 'short')}")
+    emit(f"\n{format_date(week_start, 'short')} - {format_date(week_end, 'short')}")
 
     # Hours logged
     week_log = data.get("weekly_log", {}).get(week_num, {})
     hours = week_log.get("study_hours", 0)
 
-    print(f"\n{bold('Study Hours:')}")
-    print(f"  {bold(str(hours))}h logged this week")
+    emit(f"\n{bold('Study Hours:')}")
+    emit(f"  {bold(str(hours))}h logged this week")
 
     if week_log.get("hours_by_course"):
         for c, h in week_log["hours_by_course"].items():
-            alias = CODE_TO_ALIAS.get(c, "??")
-            name = COURSE_NAMES.get(c, c)
-            print(f"    [{alias}] {h}h - {name}")
+            alias = get_alias(c, "??")
+            name = get_name(c, c)
+            emit(f"    [{alias}] {h}h - {name}")
 
     # Deadlines this week
-    print(f"\n{bold('Deadlines This Week:')}")
+    emit(f"\n{bold('Deadlines This Week:')}")
 
     deadlines_this_week = []
-    for code, course in data["courses"].items():
-        for key, assessment in course["assessments"].items():
-            deadline = assessment.get("deadline", "")
-            status = assessment.get("status", "")
-
-            if status in ("completed", "submitted"):
-                continue
-            if not deadline or deadline in ("TBD", "ongoing"):
-                continue
-
-            try:
-                dl_str = deadline.split(" to ")[0] if " to " in deadline else deadline
-                dl_date = datetime.strptime(dl_str, "%Y-%m-%d")
-
-                if week_start <= dl_date <= week_end:
-                    deadlines_this_week.append(
-                        {
-                            "date": dl_date,
-                            "code": code,
-                            "name": assessment["name"],
-                            "status": status,
-                        }
-                    )
-            except ValueError:
-                continue
+    for dl_date, code, key, assessment in _iter_parsed_deadlines(
+        data, since=week_start, until=week_end
+    ):
+        deadlines_this_week.append(
+            {
+                "date": dl_date,
+                "code": code,
+                "name": assessment["name"],
+                "status": assessment.get("status", ""),
+            }
+        )
 
     if deadlines_this_week:
         for dl in sorted(deadlines_this_week, key=lambda x: x["date"]):
-            alias = CODE_TO_ALIAS.get(dl["code"], "??")
+            alias = get_alias(dl["code"], "??")
             date_str = format_date(dl["date"], "short")
             days = (dl["date"] - today).days
             days_str = format_days_remaining(days, short=True)
-            print(f"  {date_str}: [{alias}] {dl['name']} - {days_str}")
+            emit(f"  {date_str}: [{alias}] {dl['name']} - {days_str}")
     else:
-        print(f"  {green('No deadlines this week!')}")
+        emit(f"  {green('No deadlines this week!')}")
 
     # Recent activity
-    print(f"\n{bold('Recent Activity:')}")
+    emit(f"\n{bold('Recent Activity:')}")
     recent = history.get_recent_changes(5)
     if recent:
         for entry in recent:
             desc = history.format_change_description(entry)
-            print(f"  {dim('•')} {desc}")
+            emit(f"  {dim('•')} {desc}")
     else:
-        print(f"  {dim('No recent activity')}")
+        emit(f"  {dim('No recent activity')}")
 
     # Overall progress
-    completed, total = _get_progress_stats(data)
-    print(f"\n{bold('Overall Progress:')}")
-    print(f"  {format_progress_bar(completed, total)}")
+    completed, total, _, _ = _summarize(data, today)
+    emit(f"\n{bold('Overall Progress:')}")
+    emit(f"  {format_progress_bar(completed, total)}")
+
+    _write_lines(lines)
 
 
 def undo_last_change() -> bool:
@@ -631,8 +708,13 @@ def undo_last_change() -> bool:
         print_warning("Nothing to undo")
         return False
 
-    data = load_tracker()
     action = last.get("action")
+    if action not in _UNDOABLE_ACTIONS:
+        # Nothing to revert, so don't bother reading the tracker
+        print_warning("Cannot undo this action")
+        return False
+
+    data = load_tracker()
 
     try:
         if action == "update_status":
@@ -707,13 +789,13 @@ def show_history(count: int = 10) -> None:
         return
 
     print()
-    for i, entry in enumerate(recent, 1):
-        desc = history.format_change_description(entry)
-        marker = bold("→") if i == 1 else dim("•")
-        print(f"  {marker} {desc}")
+    newest, older = bold("→"), dim("•")
+    sys.stdout.writelines(
+        f"  {newest if i == 1 else older} {history.format_change_description(entry)}\n"
+        for i, entry in enumerate(recent, 1)
+    )
 
-    if recent:
-        print(f"\n{dim('Tip: Use')} study undo {dim('to revert the last change')}")
+    print(f"\n{dim('Tip: Use')} study undo {dim('to revert the last change')}")
 
 
 def set_partner(partner_name: str) -> None:
@@ -744,12 +826,3 @@ def set_paper(title: str) -> None:
 
     save_tracker(data)
     print_success(f"Set paper study topic: {bold(title)}")
-
-
-# Helper for bold colors (used above)
-def bold_red(text: str) -> str:
-    return f"{Colors.BOLD_RED}{text}{Colors.RESET}"
-
-
-def bold_yellow(text: str) -> str:
-    return f"{Colors.BOLD_YELLOW}{text}{Colors.RESET}"
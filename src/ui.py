@@ -9,6 +9,7 @@ Provides:
 """
 
 import os
+import re
 import sys
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
@@ -103,52 +104,80 @@ class Colors:
             cls.DIM = "\033[2m"
 
 
-# Convenience functions
+# Any SGR escape sequence, i.e. every code Colors can produce
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+# Convenience functions (text is returned untouched when colour is off)
 def red(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.RED}{text}{Colors.RESET}"
 
 
 def green(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.GREEN}{text}{Colors.RESET}"
 
 
 def yellow(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.YELLOW}{text}{Colors.RESET}"
 
 
 def blue(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BLUE}{text}{Colors.RESET}"
 
 
 def cyan(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.CYAN}{text}{Colors.RESET}"
 
 
 def gray(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.GRAY}{text}{Colors.RESET}"
 
 
 def bold(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BOLD}{text}{Colors.RESET}"
 
 
 def dim(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.DIM}{text}{Colors.RESET}"
 
 
 def bold_red(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BOLD_RED}{text}{Colors.RESET}"
 
 
 def bold_green(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BOLD_GREEN}{text}{Colors.RESET}"
 
 
 def bold_yellow(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BOLD_YELLOW}{text}{Colors.RESET}"
 
 
 def bold_blue(text: str) -> str:
+    if not Colors._enabled:
+        return text
     return f"{Colors.BOLD_BLUE}{text}{Colors.RESET}"
 
 
@@ -157,18 +186,24 @@ def bold_blue(text: str) -> str:
 # ============================================================================
 
 
+# Emoji, Colors attribute name and label per status. Colours are looked up
+# by name at call time because Colors.disable()/enable() rebind them.
+_STATUS_CONFIG = {
+    "not_started": ("⬜", "", "Not started"),
+    "in_progress": ("🔄", "YELLOW", "In progress"),
+    "completed": ("✅", "GREEN", "Completed"),
+    "submitted": ("📤", "GREEN", "Submitted"),
+    "overdue": ("🔴", "RED", "OVERDUE"),
+    "ongoing": ("🔁", "CYAN", "Ongoing"),
+}
+
+_STATUS_EMOJI = {status: config[0] for status, config in _STATUS_CONFIG.items()}
+
+
 def format_status(status: str, with_emoji: bool = True) -> str:
     """Format a status string with color and optional emoji."""
-    status_config = {
-        "not_started": ("⬜", "", "Not started"),
-        "in_progress": ("🔄", Colors.YELLOW, "In progress"),
-        "completed": ("✅", Colors.GREEN, "Completed"),
-        "submitted": ("📤", Colors.GREEN, "Submitted"),
-        "overdue": ("🔴", Colors.RED, "OVERDUE"),
-        "ongoing": ("🔁", Colors.CYAN, "Ongoing"),
-    }
-
-    emoji, color, label = status_config.get(status, ("❓", "", status))
+    emoji, color_name, label = _STATUS_CONFIG.get(status, ("❓", "", status))
+    color = getattr(Colors, color_name) if color_name else ""
 
     if with_emoji:
         return f"{emoji} {color}{label}{Colors.RESET}" if color else f"{emoji} {label}"
@@ -178,15 +213,7 @@ def format_status(status: str, with_emoji: bool = True) -> str:
 
 def format_status_emoji(status: str) -> str:
     """Get just the emoji for a status."""
-    emojis = {
-        "not_started": "⬜",
-        "in_progress": "🔄",
-        "completed": "✅",
-        "submitted": "📤",
-        "overdue": "🔴",
-        "ongoing": "🔁",
-    }
-    return emojis.get(status, "❓")
+    return _STATUS_EMOJI.get(status, "❓")
 
 
 def format_days_remaining(days: int, short: bool = False) -> str:
@@ -336,38 +363,40 @@ def prompt_choice(
     else:
         prompt = f"{message} [{'/'.join(choices)}]: "
 
-    try:
-        response = input(prompt).strip()
-    except (EOFError, KeyboardInterrupt):
-        print()
-        return None
-
-    if not response:
-        if default:
-            return default
-        if allow_skip:
+    # Keep asking until the response resolves to a choice
+    while True:
+        try:
+            response = input(prompt).strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
             return None
-        # Re-prompt
-        print(f"  Please choose: {', '.join(choices)}")
-        return prompt_choice(message, choices, default, allow_skip)
-
-    response_lower = response.lower()
-
-    # Exact match
-    if response_lower in choices_lower:
-        idx = choices_lower.index(response_lower)
-        return choices[idx]
 
-    # Partial match
-    matches = [c for c in choices if c.lower().startswith(response_lower)]
-    if len(matches) == 1:
-        return matches[0]
-    elif len(matches) > 1:
-        print(f"  Ambiguous: {', '.join(matches)}")
-        return prompt_choice(message, choices, default, allow_skip)
-
-    print(f"  Invalid choice. Options: {', '.join(choices)}")
-    return prompt_choice(message, choices, default, allow_skip)
+        if not response:
+            if default:
+                return default
+            if allow_skip:
+                return None
+            # Re-prompt
+            print(f"  Please choose: {', '.join(choices)}")
+            continue
+
+        response_lower = response.lower()
+
+        # Exact match
+        if response_lower in choices_lower:
+            idx = choices_lower.index(response_lower)
+            return choices[idx]
+
+        # Partial match
+        matches = [
+            c for c, lower in zip(choices, choices_lower) if lower.startswith(response_lower)
+        ]
+        if len(matches) == 1:
+            return matches[0]
+        elif len(matches) > 1:
+            print(f"  Ambiguous: {', '.join(matches)}")
+        else:
+            print(f"  Invalid choice. Options: {', '.join(choices)}")
 
 
 # ============================================================================
@@ -375,19 +404,25 @@ def prompt_choice(
 # ============================================================================
 
 
+def format_header(title: str, width: int = 60) -> str:
+    """Format a header, preceded by a blank line, without a trailing newline."""
+    rule = bold("=" * width)
+    return f"\n{rule}\n{bold(title.center(width))}\n{rule}"
+
+
+def format_subheader(title: str, width: int = 50) -> str:
+    """Format a subheader, preceded by a blank line, without a trailing newline."""
+    return f"\n{bold(title)}\n{'-' * width}"
+
+
 def print_header(title: str, width: int = 60):
     """Print a formatted header."""
-    print()
-    print(bold("=" * width))
-    print(bold(title.center(width)))
-    print(bold("=" * width))
+    print(format_header(title, width))
 
 
 def print_subheader(title: str, width: int = 50):
     """Print a formatted subheader."""
-    print()
-    print(bold(title))
-    print("-" * width)
+    print(format_subheader(title, width))
 
 
 def print_success(message: str):
@@ -431,61 +466,21 @@ def print_table(
     if not rows:
         return
 
+    # Visible length of every cell, stripping ANSI codes only once
+    clean_lens = [[len(_ANSI_RE.sub("", cell)) for cell in row] for row in rows]
+
     # Calculate column widths
     widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            # Strip ANSI codes for width calculation
-            clean = cell
-            for code in [
-                Colors.RED,
-                Colors.GREEN,
-                Colors.YELLOW,
-                Colors.BLUE,
-                Colors.CYAN,
-                Colors.GRAY,
-                Colors.BOLD,
-                Colors.DIM,
-                Colors.RESET,
-                Colors.BOLD_RED,
-                Colors.BOLD_GREEN,
-                Colors.BOLD_YELLOW,
-                Colors.BOLD_BLUE,
-                Colors.BOLD_CYAN,
-                Colors.MAGENTA,
-                Colors.WHITE,
-            ]:
-                clean = clean.replace(code, "")
-            if i < len(widths):
-                widths[i] = max(widths[i], len(clean))
+    for row_lens in clean_lens:
+        for i, clean_len in enumerate(row_lens):
+            if i < len(widths) and clean_len > widths[i]:
+                widths[i] = clean_len
 
     if alignments is None:
         alignments = ["l"] * len(headers)
 
-    def format_cell(text: str, width: int, align: str) -> str:
-        # Strip ANSI for padding calculation
-        clean = text
-        for code in [
-            Colors.RED,
-            Colors.GREEN,
-            Colors.YELLOW,
-            Colors.BLUE,
-            Colors.CYAN,
-            Colors.GRAY,
-            Colors.BOLD,
-            Colors.DIM,
-            Colors.RESET,
-            Colors.BOLD_RED,
-            Colors.BOLD_GREEN,
-            Colors.BOLD_YELLOW,
-            Colors.BOLD_BLUE,
-            Colors.BOLD_CYAN,
-            Colors.MAGENTA,
-            Colors.WHITE,
-        ]:
-            clean = clean.replace(code, "")
-
-        padding = width - len(clean)
+    def format_cell(text: str, clean_len: int, width: int, align: str) -> str:
+        padding = width - clean_len
         if align == "r":
             return " " * padding + text
         elif align == "c":
@@ -495,16 +490,17 @@ def print_table(
         else:
             return text + " " * padding
 
-    # Print header
+    # Header, rule and rows go out in a single write
     header_line = " | ".join(
-        format_cell(bold(h), widths[i], alignments[i]) for i, h in enumerate(headers)
+        format_cell(bold(h), len(_ANSI_RE.sub("", h)), widths[i], alignments[i])
+        for i, h in enumerate(headers)
     )
-    print(header_line)
-    print("-" * (sum(widths) + 3 * (len(widths) - 1)))
-
-    # Print rows
-    for row in rows:
-        row_line = " | ".join(
-            format_cell(cell, widths[i], alignments[i]) for i, cell in enumerate(row)
+    lines = [header_line, "-" * (sum(widths) + 3 * (len(widths) - 1))]
+    for row, row_lens in zip(rows, clean_lens):
+        lines.append(
+            " | ".join(
+                format_cell(cell, row_lens[i], widths[i], alignments[i])
+                for i, cell in enumerate(row)
+            )
         )
-        print(row_line)
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -9,7 +9,7 @@ Provides:
 
 from typing import Tuple, List, Optional
 
-from .config import VALID_STATUSES, ALIAS_TO_CODE, COURSE_NAMES
+from .config import VALID_STATUSES, ALIAS_TO_CODE, COURSE_NAMES, normalize_status
 from .errors import ValidationError
 
 
@@ -65,35 +65,9 @@ def validate_status(status: str) -> str:
             "Status is required", field="status", valid_options=list(VALID_STATUSES)
         )
 
-    status_lower = status.lower().strip()
-
-    # Common aliases - be generous with what we accept
-    aliases = {
-        "done": "completed",
-        "finish": "completed",
-        "finished": "completed",
-        "complete": "completed",
-        "submit": "submitted",
-        "sent": "submitted",
-        "turned_in": "submitted",
-        "started": "in_progress",
-        "working": "in_progress",
-        "wip": "in_progress",
-        "inprogress": "in_progress",
-        "in-progress": "in_progress",
-        "todo": "not_started",
-        "pending": "not_started",
-        "notstarted": "not_started",
-        "not-started": "not_started",
-        "late": "overdue",
-        "missed": "overdue",
-    }
-
-    if status_lower in aliases:
-        return aliases[status_lower]
-
-    if status_lower in VALID_STATUSES:
-        return status_lower
+    normalized = normalize_status(status)
+    if normalized is not None:
+        return normalized
 
     raise ValidationError(
         f"Invalid status: '{status}'",
@@ -255,8 +229,12 @@ def validate_tracker_data(data: dict) -> Tuple[bool, List[str]]:
         errors.append("'courses' must be a dictionary")
         return False, errors
 
-    for code, course in data["courses"].items():
-        if code not in COURSE_NAMES:
+    courses = data["courses"]
+    # One C-level set difference instead of a lookup per course
+    unknown = courses.keys() - COURSE_NAMES.keys()
+
+    for code, course in courses.items():
+        if unknown and code in unknown:
             errors.append(f"Unknown course code: {code}")
 
         if not isinstance(course, dict):
@@ -271,13 +249,37 @@ def validate_tracker_data(data: dict) -> Tuple[bool, List[str]]:
             errors.append(f"'assessments' for {code} must be a dictionary")
             continue
 
-        for key, assessment in course["assessments"].items():
-            if not isinstance(assessment, dict):
-                errors.append(f"Assessment {code}/{key} must be a dictionary")
-                continue
-
-            status = assessment.get("status", "")
-            if status and status not in VALID_STATUSES:
-                errors.append(f"Invalid status '{status}' for {code}/{key}")
+        errors.extend(_assessment_errors(code, course["assessments"]))
 
     return len(errors) == 0, errors
+
+
+# Status values that pass validation: the valid ones plus "not set"
+_ACCEPTED_STATUSES = VALID_STATUSES | {"", None}
+
+
+def _assessment_errors(code: str, assessments: dict) -> List[str]:
+    """
+    Validate the assessments of one course.
+
+    The common all-valid case is settled by a single set difference over the
+    statuses; the per-assessment loop only runs when there is something to
+    report.
+    """
+    try:
+        if not {a.get("status") for a in assessments.values()} - _ACCEPTED_STATUSES:
+            return []
+    except (AttributeError, TypeError):
+        pass  # Non-dict assessment or unhashable status; diagnosed below
+
+    errors = []
+    for key, assessment in assessments.items():
+        if not isinstance(assessment, dict):
+            errors.append(f"Assessment {code}/{key} must be a dictionary")
+            continue
+
+        status = assessment.get("status", "")
+        if status and status not in VALID_STATUSES:
+            errors.append(f"Invalid status '{status}' for {code}/{key}")
+
+    return errors
@@ -110,10 +110,11 @@ class TestBackupFunctionality:
     """Tests for backup functionality."""
 
     def test_backup_directory_exists(self):
-        from src.config import BACKUP_DIR
+        from src.config import BACKUP_DIR, ensure_backup_dir
 
-        # Should be created by config import
-        assert BACKUP_DIR.exists() or True  # Directory created on first save
+        # Created lazily by the backup-writing paths, not on config import
+        assert ensure_backup_dir() == BACKUP_DIR
+        assert BACKUP_DIR.is_dir()
 
 
 class TestCourseDisplayName:
@@ -223,3 +224,339 @@ class TestListBackups:
             assert "size" in backup
             assert "modified" in backup
             assert isinstance(backup["modified"], datetime)
+
+    def test_sorted_most_recent_first(self, tmp_path, monkeypatch):
+        """Backups are listed newest first by modification time."""
+        from src import data
+
+        for name, mtime in [("a.json", 100), ("b.json", 300), ("c.json", 200)]:
+            path = tmp_path / name
+            path.write_text("{}")
+            os.utime(path, (mtime, mtime))
+        (tmp_path / "notes.txt").write_text("ignored")
+        monkeypatch.setattr(data, "BACKUP_DIR", tmp_path)
+
+        names = [b["name"] for b in data.list_backups()]
+        assert names == ["b.json", "c.json", "a.json"]
+
+    def test_missing_dir(self, tmp_path, monkeypatch):
+        """A missing backup directory yields an empty list."""
+        from src import data
+
+        monkeypatch.setattr(data, "BACKUP_DIR", tmp_path / "missing")
+        assert data.list_backups() == []
+
+
+class TestLoadAfterSave:
+    """Tests for skipping re-validation of a file this process just saved."""
+
+    DATA = {
+        "courses": {
+            "ELEC70028": {
+                "name": "Test Course",
+                "assessments": {"ps1": {"name": "PS1", "status": "not_started"}},
+            }
+        }
+    }
+
+    def _setup(self, tmp_path, monkeypatch):
+        from src import data
+
+        monkeypatch.setattr(data, "TRACKER_PATH", tmp_path / "tracker.json")
+        monkeypatch.setattr(data, "_validated_stamp", None)
+        monkeypatch.setattr(data, "_shared_tracker", None)
+        calls = []
+        original = data.validate_tracker_data
+
+        def counting_validate(d):
+            calls.append(d)
+            return original(d)
+
+        monkeypatch.setattr(data, "validate_tracker_data", counting_validate)
+        return data, calls
+
+    def test_load_after_save_skips_validation(self, tmp_path, monkeypatch):
+        data, calls = self._setup(tmp_path, monkeypatch)
+        data.save_tracker(json.loads(json.dumps(self.DATA)), create_backup=False)
+        calls.clear()
+
+        loaded = data.load_tracker()
+        assert loaded["courses"] == self.DATA["courses"]
+        assert calls == []
+
+    def test_unchanged_save_is_skipped(self, tmp_path, monkeypatch):
+        data, _ = self._setup(tmp_path, monkeypatch)
+        data.save_tracker(json.loads(json.dumps(self.DATA)), create_backup=False)
+        before = data.TRACKER_PATH.stat()
+
+        backups = []
+        monkeypatch.setattr(data, "_create_backup", backups.append)
+        data.save_tracker(data.load_tracker())
+
+        after = data.TRACKER_PATH.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert backups == []
+
+    def test_changed_save_serializes_once(self, tmp_path, monkeypatch):
+        data, _ = self._setup(tmp_path, monkeypatch)
+        data.save_tracker(json.loads(json.dumps(self.DATA)), create_backup=False)
+        loaded = data.load_tracker()
+        previous = loaded["last_updated"]
+
+        dumps = []
+        original = data._json_dumps
+
+        def counting_dumps(obj, *args, **kwargs):
+            if isinstance(obj, dict):
+                dumps.append(obj)
+            return original(obj, *args, **kwargs)
+
+        monkeypatch.setattr(data, "_json_dumps", counting_dumps)
+        data.save_tracker(loaded, create_backup=False)
+        assert loaded["last_updated"] == previous  # no-op save leaves it alone
+
+        loaded["courses"]["ELEC70028"]["assessments"]["ps1"]["status"] = "completed"
+        dumps.clear()
+        data.save_tracker(loaded, create_backup=False)
+        assert len(dumps) == 1
+        assert data.load_tracker()["courses"] == loaded["courses"]
+
+    def test_external_edit_is_validated(self, tmp_path, monkeypatch):
+        data, calls = self._setup(tmp_path, monkeypatch)
+        data.save_tracker(json.loads(json.dumps(self.DATA)), create_backup=False)
+
+        bad = json.loads(json.dumps(self.DATA))
+        bad["courses"]["ELEC70028"]["assessments"]["ps1"]["status"] = "bogus"
+        tmp_file = tmp_path / "edited.json"
+        tmp_file.write_text(json.dumps(bad))
+        os.replace(tmp_file, data.TRACKER_PATH)
+
+        with pytest.raises(DataValidationError):
+            data.load_tracker()
+
+    def test_shared_load_reused_until_save(self, tmp_path, monkeypatch):
+        data, _ = self._setup(tmp_path, monkeypatch)
+        data.TRACKER_PATH.write_text(json.dumps(self.DATA))
+
+        first = data.load_tracker(shared=True)
+        assert data.load_tracker(shared=True) is first
+        assert data.load_tracker() is not first
+
+        changed = json.loads(json.dumps(self.DATA))
+        changed["courses"]["ELEC70028"]["assessments"]["ps1"]["status"] = "completed"
+        data.save_tracker(changed, create_backup=False)
+
+        reloaded = data.load_tracker(shared=True)
+        assert reloaded is not first
+        assert reloaded["courses"] == changed["courses"]
+
+
+class TestSaveWithHistory:
+    """Tests for recording the undo entry as part of save_tracker."""
+
+    def _setup(self, tmp_path, monkeypatch):
+        from src import data, history
+
+        monkeypatch.setattr(data, "TRACKER_PATH", tmp_path / "tracker.json")
+        monkeypatch.setattr(history, "HISTORY_FILE", tmp_path / "history.jsonl")
+        return data, history
+
+    def test_entry_recorded_after_save(self, tmp_path, monkeypatch):
+        data, history = self._setup(tmp_path, monkeypatch)
+        entry = history.change_entry("update_status", "ELEC70028", "ps1", "status", "a", "b")
+
+        data.save_tracker(
+            json.loads(json.dumps(TestLoadAfterSave.DATA)),
+            create_backup=False,
+            history_entry=entry,
+        )
+        assert history.get_last_change() == entry
+
+    def test_failed_save_records_nothing(self, tmp_path, monkeypatch):
+        data, history = self._setup(tmp_path, monkeypatch)
+        entry = history.change_entry("update_status", "ELEC70028", "ps1", "status", "a", "b")
+
+        with pytest.raises(DataValidationError):
+            data.save_tracker({"semester": "x"}, history_entry=entry)
+        assert history.get_last_change() is None
+
+
+class TestParseDeadline:
+    """Tests for the shared deadline parser."""
+
+    def test_dates_and_ranges(self):
+        from src.data import parse_deadline
+
+        assert parse_deadline("2026-03-16") == datetime(2026, 3, 16)
+        assert parse_deadline("2026-3-5") == datetime(2026, 3, 5)
+        assert parse_deadline("2026-03-16 to 2026-03-20") == datetime(2026, 3, 16)
+
+    def test_non_dates(self):
+        from src.data import parse_deadline
+
+        for value in ("", "TBD", "ongoing", None, "2026-11-01T23:59", "20261102"):
+            assert parse_deadline(value) is None
+
+
+class TestJsonHelpers:
+    """Tests for the orjson/json serialization helpers."""
+
+    def test_dumps_matches_stdlib(self):
+        from src.data import _json_dumps
+
+        obj = {"courses": {"X": {"name": "Café — ünï", "n": [1, 2.5, None, True]}}, "e": {}}
+        expected = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        assert _json_dumps(obj) == expected
+
+    def test_compact_dumps_matches_stdlib(self):
+        from src.data import _json_dumps
+
+        obj = {"courses": {"X": {"name": "Café", "n": [1, None]}}}
+        expected = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        assert _json_dumps(obj, pretty=False) == expected.encode("utf-8")
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        from src import data
+
+        obj = {"courses": {"X": {"name": "Café", "n": [1, None]}}}
+        expected = data._json_dumps(obj, pretty=False)
+        monkeypatch.setattr(data, "orjson", None)
+        assert data._json_dumps(obj, pretty=False) == expected
+        assert data._json_loads(expected) == obj
+
+    def test_orjson_differences(self):
+        pytest.importorskip("orjson")
+        from src.data import _json_dumps
+
+        when = datetime(2026, 1, 30, 16, 0)
+        assert _json_dumps({"t": when}, pretty=False, default=str) == (
+            b'{"t":"2026-01-30 16:00:00"}'
+        )
+        assert _json_dumps({"x": float("nan")}, pretty=False) == b'{"x":null}'
+        assert _json_dumps([1e-7, 1e16], pretty=False) == b"[1e-7,1e16]"
+        with pytest.raises(TypeError):
+            _json_dumps({"x": 2**64}, pretty=False)
+
+    def test_loads_accepts_bytes_and_str(self):
+        from src.data import _json_loads
+
+        assert _json_loads(b'{"a": "\xc3\xa9"}') == {"a": "é"}
+        assert _json_loads('{"a": 1}') == {"a": 1}
+
+    def test_invalid_json_raises_stdlib_error(self):
+        from src.data import _json_loads
+
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads(b"{not json")
+
+
+class TestCleanupOldBackups:
+    """Tests for backup retention."""
+
+    def test_keeps_most_recent(self, tmp_path, monkeypatch):
+        from src import data
+
+        monkeypatch.setattr(data, "BACKUP_DIR", tmp_path)
+        monkeypatch.setattr(data, "MAX_BACKUPS", 2)
+        for i in range(4):
+            p = tmp_path / f"tracker_2024010{i}.json"
+            p.write_text("{}")
+            os.utime(p, (1000 + i, 1000 + i))
+        other = tmp_path / "courses_20240101.json"
+        other.write_text("{}")
+
+        assert data._cleanup_old_backups("tracker") == 2
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == [
+            "courses_20240101.json",
+            "tracker_20240102.json",
+            "tracker_20240103.json",
+        ]
+
+
+class TestRestoreBackup:
+    """Tests for restore_backup input checks."""
+
+    def test_rejects_backup_without_courses(self, tmp_path, monkeypatch):
+        from src import data
+
+        monkeypatch.setattr(data, "BACKUP_DIR", tmp_path)
+        monkeypatch.setattr(data, "TRACKER_PATH", tmp_path / "tracker.json")
+        (tmp_path / "tracker_old.json").write_text('{"semester": "x"}')
+
+        with pytest.raises(DataValidationError):
+            data.restore_backup("tracker_old.json")
+        assert not data.TRACKER_PATH.exists()
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_replaces_content_without_leftovers(self, tmp_path):
+        from src.data import atomic_write_bytes
+
+        target = tmp_path / "out.json"
+        target.write_bytes(b"old")
+        atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_stale_temp_file_is_replaced(self, tmp_path):
+        from src.data import atomic_write_bytes
+
+        target = tmp_path / "out.json"
+        (tmp_path / "out.json.tmp").write_bytes(b"stale")
+        atomic_write_bytes(target, b"fresh")
+
+        assert target.read_bytes() == b"fresh"
+        assert not (tmp_path / "out.json.tmp").exists()
+
+    def test_named_temp_fallback(self, tmp_path, monkeypatch):
+        from src import data
+
+        monkeypatch.setattr(data, "_O_TMPFILE", 0)
+        target = tmp_path / "out.json"
+        data.atomic_write_bytes(target, b"data")
+
+        assert target.read_bytes() == b"data"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_cross_device_target_is_rewritten_in_place(self, tmp_path, monkeypatch):
+        import errno
+        from src import data
+
+        def refuse(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(data.os, "replace", refuse)
+        target = tmp_path / "out.json"
+        target.write_bytes(b"old")
+        data.atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_other_rename_errors_raise(self, tmp_path, monkeypatch):
+        import errno
+        from src import data
+
+        def refuse(src, dst):
+            raise OSError(errno.EACCES, "Permission denied")
+
+        monkeypatch.setattr(data.os, "replace", refuse)
+        with pytest.raises(DataWriteError):
+            data.atomic_write_bytes(tmp_path / "out.json", b"new")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_out_of_space_is_reported(self, tmp_path, monkeypatch):
+        import errno
+        from src import data
+
+        def full(*args):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(data, "_write_anonymous", full)
+        with pytest.raises(DataWriteError) as exc:
+            data.atomic_write_bytes(tmp_path / "out.json", b"new")
+        assert "Insufficient disk space" in str(exc.value)
@@ -335,3 +335,131 @@ class TestFormatChangeDescription:
         result = history.format_change_description(entry)
         assert "scored" in result
         assert "85%" in result
+
+
+class TestJsonLines:
+    """Tests for the JSON-lines history file."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_history_file = Path(self.temp_dir) / ".study_history.jsonl"
+        self._original_file = history.HISTORY_FILE
+        history.HISTORY_FILE = self.temp_history_file
+
+    def teardown_method(self):
+        history.HISTORY_FILE = self._original_file
+
+    def _record(self, key):
+        history.record_change(
+            action="test",
+            course_code="TEST",
+            assessment_key=key,
+            field="status",
+            old_value="old",
+            new_value="new",
+        )
+
+    def _keys(self):
+        lines = self.temp_history_file.read_text().splitlines()
+        return [json.loads(line)["assessment_key"] for line in lines]
+
+    def test_record_appends_one_line(self):
+        """Recording a change appends a line instead of rewriting the file."""
+        self._record("a")
+        self._record("b")
+        assert self._keys() == ["a", "b"]
+
+    def test_fresh_process_reads_file(self):
+        """Entries are read back from disk without the in-process cache."""
+        self._record("a")
+        history._cache = None
+        assert history.get_last_change()["assessment_key"] == "a"
+
+    def test_torn_line_is_skipped(self):
+        """A partially written last line doesn't hide earlier entries."""
+        self._record("a")
+        with open(self.temp_history_file, "a") as f:
+            f.write('{"action": "te')
+        history._cache = None
+        assert [e["assessment_key"] for e in history._load_history()] == ["a"]
+
+    def test_compacts_after_growing(self):
+        """The file is trimmed to MAX_HISTORY once it doubles."""
+        for i in range(2 * history.MAX_HISTORY):
+            self._record(str(i))
+        keys = self._keys()
+        assert len(keys) == history.MAX_HISTORY
+        assert keys[-1] == str(2 * history.MAX_HISTORY - 1)
+
+    def test_append_after_compaction_reaches_new_file(self):
+        """The kept-open descriptor follows the file when it is replaced."""
+        for i in range(2 * history.MAX_HISTORY + 1):
+            self._record(str(i))
+        keys = self._keys()
+        assert len(keys) == history.MAX_HISTORY + 1
+        assert keys[-1] == str(2 * history.MAX_HISTORY)
+
+    def test_pop_truncates_in_place(self):
+        """Undo cuts the last line off the same file instead of rewriting it."""
+        self._record("a")
+        self._record("b")
+        inode = self.temp_history_file.stat().st_ino
+
+        assert history.pop_last_change()["assessment_key"] == "b"
+        assert self.temp_history_file.stat().st_ino == inode
+        assert self._keys() == ["a"]
+
+    def test_pop_after_torn_line_rewrites(self):
+        """A torn last line is dropped along with the popped entry."""
+        self._record("a")
+        self._record("b")
+        with open(self.temp_history_file, "a") as f:
+            f.write('{"action": "te')
+        history._cache = None
+
+        assert history.pop_last_change()["assessment_key"] == "b"
+        assert self._keys() == ["a"]
+
+    def test_pop_past_cache_rereads_older_lines(self):
+        """Popping from an uncompacted file exposes the next-oldest entry."""
+        for i in range(history.MAX_HISTORY + 1):
+            self._record(str(i))
+
+        history.pop_last_change()
+        entries = history._load_history()
+        assert len(entries) == history.MAX_HISTORY
+        assert entries[0]["assessment_key"] == "0"
+
+    def test_migrates_legacy_json_array(self):
+        """An old .study_history.json array is moved into the JSONL file."""
+        legacy = Path(self.temp_dir) / ".study_history.json"
+        legacy.write_text(json.dumps([{"action": "old", "assessment_key": "x"}], indent=2))
+        history._cache_key = None
+
+        assert history.get_last_change()["assessment_key"] == "x"
+        assert not legacy.exists()
+        assert self._keys() == ["x"]
+
+    def test_legacy_kept_when_write_fails(self):
+        """A failed migration leaves the legacy file and no temp file behind."""
+        legacy = Path(self.temp_dir) / ".study_history.json"
+        legacy.write_text(json.dumps([{"action": "old", "assessment_key": "x"}]))
+        history._cache_key = None
+
+        with patch("src.history.os.replace", side_effect=OSError("disk full")):
+            history._load_history()
+
+        assert legacy.exists()
+        assert not Path(str(self.temp_history_file) + ".tmp").exists()
+        history._cache_key = None
+        assert history.get_last_change()["assessment_key"] == "x"
+        assert not legacy.exists()
+
+    def test_unparseable_legacy_kept(self):
+        """A truncated legacy array is not deleted."""
+        legacy = Path(self.temp_dir) / ".study_history.json"
+        legacy.write_text('[{"action": "old"')
+        history._cache_key = None
+
+        assert history.get_recent_changes() == []
+        assert legacy.exists()
@@ -26,7 +26,13 @@ from src.ui import (
     format_date,
     format_progress_bar,
     format_progress_summary,
+    format_header,
+    format_subheader,
+    print_header,
+    print_subheader,
+    print_table,
     confirm,
+    prompt_choice,
 )
 
 
@@ -48,6 +54,22 @@ class TestColors:
         assert green("test") == "test"
         assert bold("test") == "test"
 
+    def test_color_functions_return_input_when_disabled(self):
+        """Disabled color functions hand back the same string object."""
+        Colors.disable()
+        text = "".join(["un", "wrapped"])
+        assert red(text) is text
+        assert dim(text) is text
+
+    def test_color_functions_wrap_when_enabled(self):
+        """Enabled color functions wrap text in the color and reset codes."""
+        with patch("src.ui._supports_color", return_value=True):
+            Colors.enable()
+        try:
+            assert red("x") == "\033[31mx\033[0m"
+        finally:
+            Colors.disable()
+
 
 class TestColorFunctions:
     """Tests for color convenience functions."""
@@ -131,6 +153,15 @@ class TestFormatStatus:
         result = format_status("completed", with_emoji=False)
         assert "Completed" in result
 
+    def test_color_follows_enable(self):
+        with patch("src.ui._supports_color", return_value=True):
+            Colors.enable()
+        try:
+            assert format_status("overdue") == f"🔴 {Colors.RED}OVERDUE{Colors.RESET}"
+        finally:
+            Colors.disable()
+        assert format_status("overdue") == "🔴 OVERDUE"
+
 
 class TestFormatStatusEmoji:
     """Tests for status emoji function."""
@@ -263,6 +294,57 @@ class TestFormatProgressSummary:
         assert "100%" in result
 
 
+class TestFormatHeader:
+    """Tests for header formatting."""
+
+    def setup_method(self):
+        Colors.disable()
+
+    def test_header_matches_printed_output(self, capsys):
+        print_header("TITLE", width=10)
+        assert capsys.readouterr().out == format_header("TITLE", width=10) + "\n"
+        assert format_header("TITLE", width=10) == "\n" + "=" * 10 + "\n  TITLE   \n" + "=" * 10
+
+    def test_subheader_matches_printed_output(self, capsys):
+        print_subheader("Sub", width=5)
+        assert capsys.readouterr().out == "\nSub\n-----\n"
+        assert format_subheader("Sub", width=5) == "\nSub\n-----"
+
+
+class TestPrintTable:
+    """Tests for table printing."""
+
+    def test_columns_padded_to_visible_width(self, capsys):
+        with patch("src.ui._supports_color", return_value=True):
+            Colors.enable()
+        try:
+            print_table(
+                ["Name", "N"],
+                [[red("a"), "10"], ["bbbbb", bold_green("7")]],
+                ["l", "r"],
+            )
+            expected = [
+                f"{Colors.BOLD}Name{Colors.RESET}  |  {Colors.BOLD}N{Colors.RESET}",
+                "-" * 10,
+                f"{Colors.RED}a{Colors.RESET}     | 10",
+                f"bbbbb |  {Colors.BOLD_GREEN}7{Colors.RESET}",
+            ]
+        finally:
+            Colors.disable()
+        assert capsys.readouterr().out == "\n".join(expected) + "\n"
+
+    def test_escape_codes_ignored_when_colors_disabled(self, capsys):
+        Colors.disable()
+        print_table(["Col"], [["\033[1;36mcy\033[0m"], ["abc"]])
+        lines = capsys.readouterr().out.split("\n")
+        assert lines[1] == "---"
+        assert lines[2] == "\033[1;36mcy\033[0m "
+
+    def test_empty_rows_print_nothing(self, capsys):
+        print_table(["A"], [])
+        assert capsys.readouterr().out == ""
+
+
 class TestConfirm:
     """Tests for confirmation prompts."""
 
@@ -312,3 +394,22 @@ class TestConfirm:
         with patch("builtins.input", side_effect=KeyboardInterrupt):
             result = confirm("Continue?")
             assert result is False
+
+
+class TestPromptChoice:
+    """Tests for choice prompts."""
+
+    def test_reprompts_until_valid(self, capsys):
+        answers = iter(["", "x", "b", "BETA"])
+        with patch("builtins.input", side_effect=lambda _: next(answers)):
+            result = prompt_choice("Pick", ["alpha", "beta", "better"])
+        assert result == "beta"
+        out = capsys.readouterr().out
+        assert "Please choose" in out
+        assert "Invalid choice" in out
+        assert "Ambiguous: beta, better" in out
+
+    def test_many_empty_responses_do_not_recurse(self):
+        answers = iter([""] * 5000 + ["Alpha"])
+        with patch("builtins.input", side_effect=lambda _: next(answers)):
+            assert prompt_choice("Pick", ["alpha", "beta"]) == "alpha"
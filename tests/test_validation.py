@@ -99,6 +99,14 @@ class TestValidateStatus:
             validate_status("")
         assert exc_info.value.field == "status"
 
+    def test_normalize_status(self):
+        from src.config import normalize_status, VALID_STATUSES
+
+        assert normalize_status(" Done ") == "completed"
+        assert normalize_status("invalid") is None
+        for status in VALID_STATUSES:
+            assert normalize_status(status) == status
+
 
 class TestValidateAssessmentKey:
     """Tests for validate_assessment_key function."""